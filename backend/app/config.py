@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -27,6 +29,9 @@ class Settings(BaseSettings):
     # Remediation batching (applies to all tools)
     batch_size: int = 10
 
+    # Max files an API tool (Anthropic/OpenAI/Gemini) remediates concurrently
+    api_remediation_concurrency: int = 4
+
     # Database
     database_path: str = "medsecure.db"
 
@@ -42,5 +47,18 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
+    @cached_property
+    def cors_origin_list(self) -> tuple[str, ...]:
+        """Comma-separated ``cors_origins`` split and stripped once."""
+        if self.cors_origins == "*":
+            return ("*",)
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed from env/.env once)."""
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
@@ -2,14 +2,17 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import Depends, FastAPI
+from fastapi import APIRouter, Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.config import settings
+from app.config import Settings, get_settings, settings
 from app.models.schemas import HealthResponse
 from app.routers import alerts, config, remediation, replay, reports, repos, scans
 from app.services.auth import validate_session
-from app.services.database import init_db
+from app.services.database import close_db, get_db, init_db
+from app.services.devin_client import close_devin_client
+from app.services.github_client import close_github_client, get_github_client
+from app.services.http_cache import content_etag, json_response
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -20,8 +23,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Initializing database at %s", settings.database_path)
     await init_db()
     logger.info("Database initialized")
+    app.state.db = await get_db()
+    app.state.github = get_github_client()
     yield
     logger.info("Shutting down")
+    await close_github_client()
+    await close_devin_client()
+    await close_db()
 
 
 app = FastAPI(
@@ -32,31 +40,27 @@ app = FastAPI(
 )
 
 # CORS — allow dashboard frontend
-origins = settings.cors_origins.split(",") if settings.cors_origins != "*" else ["*"]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=list(settings.cors_origin_list),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Routers — all protected by session validation
-auth_dep = [Depends(validate_session)]
-app.include_router(repos.router, dependencies=auth_dep)
-app.include_router(scans.router, dependencies=auth_dep)
-app.include_router(alerts.router, dependencies=auth_dep)
-app.include_router(remediation.router, dependencies=auth_dep)
-app.include_router(reports.router, dependencies=auth_dep)
-app.include_router(replay.router, dependencies=auth_dep)
-app.include_router(config.router, dependencies=auth_dep)
+# Routers — all protected by session validation, declared once on a parent router
+api_router = APIRouter(dependencies=[Depends(validate_session)])
+for module in (repos, scans, alerts, remediation, reports, replay, config):
+    api_router.include_router(module.router)
+app.include_router(api_router)
 
 
 @app.get("/api/health", response_model=HealthResponse)
-async def health() -> HealthResponse:
-    return HealthResponse(
+async def health(request: Request, settings: Settings = Depends(get_settings)) -> Response:
+    body = HealthResponse(
         status="ok",
         version="0.1.0",
         repo="(select a repo in the UI)",
         database=settings.database_path,
-    )
+    ).model_dump_json().encode()
+    return json_response(request, body, content_etag(body), cache_control="private, max-age=60")
@@ -1,41 +1,47 @@
-from enum import Enum
+import sys
+from typing import Annotated, Literal, get_args
 
-from pydantic import BaseModel
+from pydantic import AfterValidator, BaseModel, ConfigDict
 
+Severity = Literal["critical", "high", "medium", "low", "warning", "note", "error"]
 
-class Severity(str, Enum):
-    critical = "critical"
-    high = "high"
-    medium = "medium"
-    low = "low"
-    warning = "warning"
-    note = "note"
-    error = "error"
+AlertState = Literal["open", "closed", "dismissed", "fixed"]
 
+ToolName = Literal["baseline", "devin", "copilot", "anthropic", "openai", "gemini"]
 
-class AlertState(str, Enum):
-    open = "open"
-    closed = "closed"
-    dismissed = "dismissed"
-    fixed = "fixed"
+# Strings drawn from a small, open-ended vocabulary (e.g. scanner name).
+# Interning makes thousands of alerts share one object per value.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
+# Canonical objects for the known severity/state values ("none" is what GitHub
+# reports for alerts without a severity). Unknown values pass through as-is
+# instead of being interned, so arbitrary API strings never pile up in the
+# interpreter's intern table.
+_SEVERITY_TABLE: dict[str, str] = {v: v for v in (*get_args(Severity), "none")}
+_STATE_TABLE: dict[str, str] = {v: v for v in get_args(AlertState)}
 
-class ToolName(str, Enum):
-    baseline = "baseline"
-    devin = "devin"
-    copilot = "copilot"
-    anthropic = "anthropic"
-    openai = "openai"
-    gemini = "gemini"
+
+def _canonical_severity(value: str) -> str:
+    return _SEVERITY_TABLE.get(value, value)
+
+
+def _canonical_state(value: str) -> str:
+    return _STATE_TABLE.get(value, value)
+
+
+SeverityStr = Annotated[str, AfterValidator(_canonical_severity)]
+StateStr = Annotated[str, AfterValidator(_canonical_state)]
 
 
 class Alert(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     number: int
     rule_id: str
     rule_description: str
-    severity: str
-    state: str
-    tool: str
+    severity: SeverityStr
+    state: StateStr
+    tool: InternedStr
     file_path: str
     start_line: int
     end_line: int
@@ -47,6 +53,8 @@ class Alert(BaseModel):
 
 
 class BranchSummary(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     branch: str
     tool: str
     total: int
@@ -77,6 +85,8 @@ class ScanListItem(BaseModel):
 
 
 class CostEstimate(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     model: str
     pricing_type: str = "token"  # "token", "per_request", "acu"
     estimated_input_tokens: int = 0
@@ -104,12 +114,14 @@ class ComparisonResult(BaseModel):
 
 
 class RemediationRequest(BaseModel):
-    tool: ToolName = ToolName.devin
+    tool: ToolName = "devin"
     alert_numbers: list[int] | None = None
     batch_size: int = 5
 
 
 class DevinSession(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     session_id: str
     alert_number: int
@@ -287,6 +299,8 @@ class BenchmarkResponse(BaseModel):
 
 
 class ReplayEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     run_id: int
     tool: str
@@ -1,11 +1,16 @@
+import json
 import logging
+from collections import OrderedDict
+from typing import AsyncIterator
 
+import aiosqlite
 import httpx
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.models.schemas import Alert, AlertsResponse
-from app.services.database import get_db
-from app.services.github_client import GitHubClient
+from app.services.http_cache import etag_matches, json_response
 from app.services.repo_resolver import (
     resolve_baseline_branch,
     resolve_branch,
@@ -15,9 +20,79 @@ from app.services.repo_resolver import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/alerts", tags=["alerts"])
 
+_GITHUB_403_DETAIL = (
+    "GitHub API returned 403 Forbidden. "
+    "Your GITHUB_TOKEN likely lacks the 'security_events' scope "
+    "(classic PAT) or 'Code scanning alerts: Read' permission "
+    "(fine-grained PAT). "
+    "See: https://docs.github.com/en/rest/code-scanning"
+)
+
+# Compiled once; validates a whole page of alert rows in a single core call.
+ALERT_LIST_ADAPTER = TypeAdapter(list[Alert])
+
+# Serialized snapshot responses keyed by (scan_id, branch, tool) -> (repo, body).
+# Entries never expire, which relies on trigger_scan writing a scan's rows in
+# a single transaction on its own connection (database.transaction): a scan
+# is either not visible yet or complete, and its alerts never change after.
+# Any new writer of scans/alerts must keep that guarantee. The LRU bound only
+# caps memory.
+_SNAPSHOT_CACHE_SIZE = 256
+_snapshot_cache: OrderedDict[tuple[int, str | None, str], tuple[str, bytes]] = OrderedDict()
+
+# Rows fetched (and serialized) per chunk when streaming a snapshot
+_SNAPSHOT_FETCH_SIZE = 500
+
+
+def _cache_snapshot(key: tuple[int, str | None, str], repo: str, body: bytes) -> None:
+    _snapshot_cache[key] = (repo, body)
+    if len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+        _snapshot_cache.popitem(last=False)
+
+
+async def _stream_snapshot(
+    db: aiosqlite.Connection,
+    cache_key: tuple[int, str | None, str],
+    repo: str,
+    scan_id: int,
+    branch: str,
+    tool: str,
+    total: int,
+) -> AsyncIterator[bytes]:
+    """Yield the AlertsResponse JSON for a snapshot one fetchmany() batch at a time.
+
+    Only one batch of rows and models is alive at once; the encoded chunks
+    are kept so the complete body can be cached after it has been sent.
+    """
+    head = json.dumps({"branch": branch, "tool": tool, "total": total}, separators=(",", ":"))
+    parts = [head[:-1].encode() + b',"alerts":[']
+    yield parts[0]
+
+    cursor = await db.execute(
+        "SELECT alert_number AS number, rule_id, rule_description, severity, state, tool,"
+        " file_path, start_line, end_line, message, html_url, created_at, dismissed_at, fixed_at"
+        " FROM alerts WHERE scan_id = ? AND branch = ?",
+        (scan_id, branch),
+    )
+    try:
+        while rows := await cursor.fetchmany(_SNAPSHOT_FETCH_SIZE):
+            alerts = ALERT_LIST_ADAPTER.validate_python([dict(row) for row in rows])
+            chunk = ALERT_LIST_ADAPTER.dump_json(alerts)[1:-1]
+            if len(parts) > 1:
+                chunk = b"," + chunk
+            parts.append(chunk)
+            yield chunk
+    finally:
+        await cursor.close()
+
+    parts.append(b"]}")
+    yield parts[-1]
+    _cache_snapshot(cache_key, repo, b"".join(parts))
+
 
 @router.get("/live", response_model=AlertsResponse)
 async def get_live_alerts(
+    request: Request,
     tool: str = Query(default="baseline", description="Tool name: baseline, devin, copilot, anthropic, openai, gemini"),
     state: str | None = Query(default=None, description="Filter by state: open, fixed, dismissed"),
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
@@ -26,7 +101,7 @@ async def get_live_alerts(
     """Fetch live alerts from GitHub API for a specific tool's branch."""
     resolved_repo = await resolve_repo(repo)
     resolved_branch = await resolve_branch(resolved_repo, tool, branch)
-    github = GitHubClient(repo=resolved_repo)
+    github = request.app.state.github.for_repo(resolved_repo)
 
     try:
         alerts = await github.get_alerts(resolved_branch, state=state)
@@ -34,16 +109,7 @@ async def get_live_alerts(
     except httpx.HTTPStatusError as e:
         logger.exception("Failed to fetch live alerts for branch %s", resolved_branch)
         if e.response.status_code == 403:
-            raise HTTPException(
-                status_code=502,
-                detail=(
-                    "GitHub API returned 403 Forbidden. "
-                    "Your GITHUB_TOKEN likely lacks the 'security_events' scope "
-                    "(classic PAT) or 'Code scanning alerts: Read' permission "
-                    "(fine-grained PAT). "
-                    "See: https://docs.github.com/en/rest/code-scanning"
-                ),
-            ) from e
+            raise HTTPException(status_code=502, detail=_GITHUB_403_DETAIL) from e
         raise HTTPException(status_code=502, detail=f"GitHub API error: {e}") from e
     except Exception as e:
         logger.exception("Failed to fetch live alerts for branch %s", resolved_branch)
@@ -53,60 +119,56 @@ async def get_live_alerts(
 @router.get("/snapshot/{scan_id}", response_model=AlertsResponse)
 async def get_snapshot_alerts(
     scan_id: int,
+    request: Request,
     tool: str = Query(default="baseline", description="Tool name"),
     branch: str | None = Query(default=None, description="Explicit branch name"),
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
-) -> AlertsResponse:
+) -> Response:
     """Get stored alerts from a specific scan snapshot."""
     resolved_repo = await resolve_repo(repo)
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT repo FROM scans WHERE id = ?", (scan_id,))
-        scan = await cursor.fetchone()
-        if not scan or scan["repo"] != resolved_repo:
+    etag = f'W/"scan-{scan_id}-{branch or ""}-{tool}"'
+    cache_key = (scan_id, branch, tool)
+    cached = _snapshot_cache.get(cache_key)
+    if cached is not None:
+        cached_repo, body = cached
+        if cached_repo != resolved_repo:
             raise HTTPException(status_code=404, detail="Scan not found")
+        _snapshot_cache.move_to_end(cache_key)
+        return json_response(request, body, etag)
 
-        # Default to the baseline branch used for this scan.
-        resolved_branch = branch
-        if not resolved_branch:
-            cursor = await db.execute(
-                "SELECT branch FROM scan_branches WHERE scan_id = ? AND tool = 'baseline' LIMIT 1",
-                (scan_id,),
-            )
-            row = await cursor.fetchone()
-            resolved_branch = (
-                row["branch"] if row else await resolve_baseline_branch(resolved_repo)
-            )
+    db = request.app.state.db
+    cursor = await db.execute("SELECT repo FROM scans WHERE id = ?", (scan_id,))
+    scan = await cursor.fetchone()
+    if not scan or scan["repo"] != resolved_repo:
+        raise HTTPException(status_code=404, detail="Scan not found")
 
+    # Default to the baseline branch used for this scan.
+    resolved_branch = branch
+    if not resolved_branch:
         cursor = await db.execute(
-            "SELECT * FROM alerts WHERE scan_id = ? AND branch = ?",
-            (scan_id, resolved_branch),
+            "SELECT branch FROM scan_branches WHERE scan_id = ? AND tool = 'baseline' LIMIT 1",
+            (scan_id,),
+        )
+        row = await cursor.fetchone()
+        resolved_branch = (
+            row["branch"] if row else await resolve_baseline_branch(resolved_repo)
         )
-        rows = await cursor.fetchall()
-
-        if not rows:
-            raise HTTPException(status_code=404, detail="No alerts found for this scan/branch")
-
-        alerts = [
-            Alert(
-                number=row["alert_number"],
-                rule_id=row["rule_id"],
-                rule_description=row["rule_description"],
-                severity=row["severity"],
-                state=row["state"],
-                tool=row["tool"],
-                file_path=row["file_path"],
-                start_line=row["start_line"],
-                end_line=row["end_line"],
-                message=row["message"],
-                html_url=row["html_url"],
-                created_at=row["created_at"],
-                dismissed_at=row["dismissed_at"],
-                fixed_at=row["fixed_at"],
-            )
-            for row in rows
-        ]
 
-        return AlertsResponse(branch=resolved_branch, tool=tool, total=len(alerts), alerts=alerts)
-    finally:
-        await db.close()
+    cursor = await db.execute(
+        "SELECT COUNT(*) AS total FROM alerts WHERE scan_id = ? AND branch = ?",
+        (scan_id, resolved_branch),
+    )
+    total = (await cursor.fetchone())["total"]
+    if not total:
+        raise HTTPException(status_code=404, detail="No alerts found for this scan/branch")
+
+    # Snapshots are complete and immutable once visible (see _snapshot_cache),
+    # so the ETag alone proves the client's copy is current.
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return StreamingResponse(
+        _stream_snapshot(db, cache_key, resolved_repo, scan_id, resolved_branch, tool, total),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
 from app.models.schemas import RepoConfig
+from app.services.http_cache import content_etag, json_response
 from app.services.repo_resolver import resolve_baseline_branch, resolve_repo
 
 router = APIRouter(prefix="/api/config", tags=["config"])
@@ -8,12 +9,14 @@ router = APIRouter(prefix="/api/config", tags=["config"])
 
 @router.get("", response_model=RepoConfig)
 async def get_config(
+    request: Request,
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
-) -> RepoConfig:
+) -> Response:
     """Get current repository configuration for a repo."""
     resolved_repo = await resolve_repo(repo)
     baseline_branch = await resolve_baseline_branch(resolved_repo)
-    return RepoConfig(
+    body = RepoConfig(
         github_repo=resolved_repo,
         branch_baseline=baseline_branch,
-    )
+    ).model_dump_json().encode()
+    return json_response(request, body, content_etag(body), cache_control="private, max-age=60")
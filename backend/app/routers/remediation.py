@@ -1,13 +1,18 @@
 import asyncio
+import itertools
 import json
 import logging
+import random
 import time as _time
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime, timezone
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Mapping
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 
-from app.config import settings
+from app.config import Settings, get_settings, settings
 from app.models.schemas import (
     Alert,
     ApiRemediationJob,
@@ -23,9 +28,10 @@ from app.models.schemas import (
     RemediationResponse,
 )
 from app.services.database import get_db
-from app.services.devin_client import DevinClient
-from app.services.github_client import GitHubClient
+from app.services.devin_client import get_devin_client
+from app.services.github_client import GitHubClient, get_github_client
 from app.services.llm_client import call_llm_with_delay
+from app.services.rate_limit import AsyncRateLimiter, retry_on_rate_limit
 from app.services.replay_recorder import (
     COPILOT_COST_PER_REQUEST,
     ReplayRecorder,
@@ -36,7 +42,7 @@ from app.services.repo_resolver import resolve_baseline_branch, resolve_repo
 from app.services.token_counter import (
     build_grouped_prompt_for_file,
     build_prompt_for_alert,
-    count_tokens,
+    count_tokens_async,
 )
 
 logger = logging.getLogger(__name__)
@@ -49,20 +55,59 @@ _API_TOOL_CONFIG = {
     "gemini": "gemini_api_key",
 }
 
+# Suffix for remediation branch names: seeded from the clock but strictly
+# increasing, so two runs started in the same second never collide.
+_branch_counter = itertools.count(int(_time.time()))
+
 
 def _group_alerts_by_file(alerts: list[Alert]) -> dict[str, list[Alert]]:
     """Group alerts by file_path so multiple alerts in the same file
-    can be processed together, avoiding conflicts."""
-    groups: dict[str, list[Alert]] = defaultdict(list)
-    for alert in alerts:
-        groups[alert.file_path].append(alert)
-    return dict(groups)
+    can be processed together, avoiding conflicts.
+
+    Groups are returned in file_path order; alerts keep their relative order.
+    """
+    by_path = attrgetter("file_path")
+    return {path: list(group) for path, group in itertools.groupby(sorted(alerts, key=by_path), key=by_path)}
+
+
+async def _open_alerts_with_branch(
+    github: GitHubClient, baseline_branch: str, branch_name: str,
+) -> list[Alert]:
+    """Fetch the baseline's open alerts while creating ``branch_name`` from it.
+
+    The two GitHub calls are independent, so they run concurrently. If the
+    alert fetch fails the new branch is removed again and the error re-raised.
+    """
+    alerts, created = await asyncio.gather(
+        github.get_open_alerts(baseline_branch),
+        github.create_branch(branch_name, from_branch=baseline_branch),
+        return_exceptions=True,
+    )
+    if isinstance(alerts, BaseException):
+        if not isinstance(created, BaseException):
+            await _discard_branch(github, branch_name)
+        raise alerts
+    if isinstance(created, BaseException):
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to create branch {branch_name}: {created}",
+        ) from created
+    return alerts
+
+
+async def _discard_branch(github: GitHubClient, branch_name: str) -> None:
+    """Best-effort removal of a remediation branch that ended up unused."""
+    try:
+        await github.delete_branch(branch_name)
+    except Exception:
+        logger.warning("Failed to delete unused branch %s", branch_name, exc_info=True)
 
 
 @router.post("/devin", response_model=RemediationResponse)
 async def trigger_devin_remediation(
     request: RemediationRequest,
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
+    settings: Settings = Depends(get_settings),
 ) -> RemediationResponse:
     """Create Devin sessions to fix CodeQL alerts.
 
@@ -75,40 +120,31 @@ async def trigger_devin_remediation(
     resolved_repo = await resolve_repo(repo)
     baseline_branch = await resolve_baseline_branch(resolved_repo)
 
-    github = GitHubClient(repo=resolved_repo)
-    devin = DevinClient()
+    github = get_github_client(resolved_repo)
+    devin = get_devin_client()
 
-    # Get open alerts from baseline branch
-    alerts = await github.get_alerts(baseline_branch, state="open")
+    # Get open alerts from baseline while creating a fresh branch for this run
+    branch_name = f"remediate/devin-{next(_branch_counter)}"
+    alerts = await _open_alerts_with_branch(github, baseline_branch, branch_name)
 
     if request.alert_numbers:
         alerts = [a for a in alerts if a.number in request.alert_numbers]
 
     if not alerts:
+        await _discard_branch(github, branch_name)
         return RemediationResponse(sessions_created=0, sessions=[], message="No open alerts to remediate")
 
     # Batch by file groups (batch_size counts files)
     batch_size = max(1, request.batch_size)
     file_groups_all = _group_alerts_by_file(alerts)
-    selected_paths = sorted(file_groups_all.keys())[:batch_size]
-    file_groups = {p: file_groups_all[p] for p in selected_paths}
-    alerts = [a for p in selected_paths for a in file_groups_all[p]]
-
-    # Create a fresh branch from baseline for this remediation run
-    branch_name = f"remediate/devin-{int(__import__('time').time())}"
-    try:
-        await github.create_branch(branch_name, from_branch=baseline_branch)
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create branch {branch_name}: {e}",
-        ) from e
+    file_groups = dict(itertools.islice(file_groups_all.items(), batch_size))
+    alerts = list(itertools.chain.from_iterable(file_groups.values()))
 
     # Start replay recording with the new branch name
     recorder = ReplayRecorder(tools=["devin"], branch_name=branch_name, repo=resolved_repo)
     await recorder.start()
 
-    await recorder.record(
+    recorder.record(
         tool="devin",
         event_type="scan_started",
         detail=f"CodeQL scan detected {len(alerts)} open alerts across {len(file_groups)} files",
@@ -126,6 +162,15 @@ async def trigger_devin_remediation(
     sessions_created: list[DevinSession] = []
 
     try:
+        # Look up active sessions for every selected alert in one query
+        cursor = await db.execute(
+            """SELECT alert_number, session_id FROM devin_sessions
+               WHERE repo = ? AND alert_number IN (SELECT value FROM json_each(?))
+               AND status NOT IN ('failed', 'stopped')""",
+            (resolved_repo, json.dumps([a.number for a in alerts])),
+        )
+        existing_by_num = {row["alert_number"]: row["session_id"] for row in await cursor.fetchall()}
+
         for file_path, file_alerts in file_groups.items():
             alert_nums = [a.number for a in file_alerts]
 
@@ -133,24 +178,18 @@ async def trigger_devin_remediation(
             skipped_alerts: list[Alert] = []
             new_alerts: list[Alert] = []
             for alert in file_alerts:
-                cursor = await db.execute(
-                    "SELECT * FROM devin_sessions "
-                    "WHERE repo = ? AND alert_number = ? "
-                    "AND status NOT IN ('failed', 'stopped')",
-                    (resolved_repo, alert.number),
-                )
-                existing = await cursor.fetchone()
-                if existing:
-                    logger.info("Skipping alert %d, already has session %s", alert.number, existing["session_id"])
-                    await recorder.record(
+                if alert.number in existing_by_num:
+                    existing_session_id = existing_by_num[alert.number]
+                    logger.info("Skipping alert %d, already has session %s", alert.number, existing_session_id)
+                    recorder.record(
                         tool="devin",
                         event_type="alert_skipped",
-                        detail=f"Alert #{alert.number} already has active session {existing['session_id']}",
+                        detail=f"Alert #{alert.number} already has active session {existing_session_id}",
                         alert_number=alert.number,
                         metadata={
                             "rule_id": alert.rule_id,
                             "file_path": alert.file_path,
-                            "existing_session_id": existing["session_id"],
+                            "existing_session_id": existing_session_id,
                         },
                     )
                     skipped_alerts.append(alert)
@@ -160,8 +199,12 @@ async def trigger_devin_remediation(
             if not new_alerts:
                 continue
 
+            new_alert_nums = [a.number for a in new_alerts]
+            new_rule_ids = [a.rule_id for a in new_alerts]
+            new_severities = [a.severity for a in new_alerts]
+
             try:
-                await recorder.record(
+                recorder.record(
                     tool="devin",
                     event_type="session_created",
                     detail=(
@@ -171,9 +214,9 @@ async def trigger_devin_remediation(
                     metadata={
                         "file_path": file_path,
                         "alert_count": len(new_alerts),
-                        "alert_numbers": [a.number for a in new_alerts],
-                        "rules": [a.rule_id for a in new_alerts],
-                        "severities": [a.severity for a in new_alerts],
+                        "alert_numbers": new_alert_nums,
+                        "rules": new_rule_ids,
+                        "severities": new_severities,
                         "branch": branch_name,
                     },
                 )
@@ -190,37 +233,35 @@ async def trigger_devin_remediation(
                 session_id = result.get("session_id", "")
 
                 # Record a devin_sessions row per alert (all share same session_id)
-                for alert in new_alerts:
-                    await db.execute(
-                        """INSERT INTO devin_sessions (repo, session_id, alert_number, rule_id, file_path, status)
-                           VALUES (?, ?, ?, ?, ?, 'running')""",
-                        (resolved_repo, session_id, alert.number, alert.rule_id, alert.file_path),
-                    )
-                # Commit after INSERTs to release SQLite write lock so
-                # ReplayRecorder (which uses its own connection) can write.
-                await db.commit()
-
-                cursor = await db.execute(
-                    "SELECT * FROM devin_sessions WHERE repo = ? AND session_id = ? LIMIT 1",
-                    (resolved_repo, session_id),
+                values = ", ".join(["(?, ?, ?, ?, ?, 'running')"] * len(new_alerts))
+                # execute_fetchall steps the RETURNING statement to completion in one
+                # call, so a concurrent commit on the shared connection can't land
+                # while it is still in progress.
+                rows = await db.execute_fetchall(
+                    f"""INSERT INTO devin_sessions (repo, session_id, alert_number, rule_id, file_path, status)
+                        VALUES {values} RETURNING id, created_at, updated_at""",
+                    [p for a in new_alerts for p in (resolved_repo, session_id, a.number, a.rule_id, a.file_path)],
                 )
-                row = await cursor.fetchone()
-                if row:
-                    sessions_created.append(
-                        DevinSession(
-                            id=row["id"],
-                            session_id=row["session_id"],
-                            alert_number=row["alert_number"],
-                            rule_id=row["rule_id"],
-                            file_path=row["file_path"],
-                            status=row["status"],
-                            pr_url=row["pr_url"],
-                            created_at=row["created_at"],
-                            updated_at=row["updated_at"],
-                        )
+                # Commit before the next group's Devin call so the write
+                # transaction never stays open across a network await
+                await db.commit()
+                # The group is reported by its first row (lowest id = new_alerts[0])
+                row = min(rows, key=lambda r: r["id"])
+                first = new_alerts[0]
+                sessions_created.append(
+                    DevinSession.model_construct(
+                        id=row["id"],
+                        session_id=session_id,
+                        alert_number=first.number,
+                        rule_id=first.rule_id,
+                        file_path=first.file_path,
+                        status="running",
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
                     )
+                )
 
-                await recorder.record(
+                recorder.record(
                     tool="devin",
                     event_type="analyzing",
                     detail=(
@@ -231,7 +272,7 @@ async def trigger_devin_remediation(
                     metadata={
                         "session_id": session_id,
                         "file_path": file_path,
-                        "alert_numbers": [a.number for a in new_alerts],
+                        "alert_numbers": new_alert_nums,
                         "branch": branch_name,
                     },
                 )
@@ -243,23 +284,22 @@ async def trigger_devin_remediation(
                     file_path,
                 )
             except Exception as e:
+                error_msg = str(e)[:500]
                 logger.exception("Failed to create Devin session for file %s", file_path)
-                await recorder.record(
+                recorder.record(
                     tool="devin",
                     event_type="error",
-                    detail=f"Failed to create session for {file_path} (alerts {alert_nums}): {str(e)[:200]}",
+                    detail=f"Failed to create session for {file_path} (alerts {alert_nums}): {error_msg[:200]}",
                     alert_number=new_alerts[0].number,
                     metadata={
-                        "error": str(e)[:500],
+                        "error": error_msg,
                         "file_path": file_path,
                         "alert_numbers": alert_nums,
                     },
                 )
 
-        await db.commit()
-
         # Record completion
-        await recorder.record(
+        recorder.record(
             tool="devin",
             event_type="remediation_complete",
             detail=(
@@ -286,8 +326,6 @@ async def trigger_devin_remediation(
     except Exception:
         await recorder.finish("failed")
         raise
-    finally:
-        await db.close()
 
 
 @router.get("/devin/sessions", response_model=list[DevinSession])
@@ -297,36 +335,35 @@ async def list_devin_sessions(
     """List Devin remediation sessions for a repo."""
     resolved_repo = await resolve_repo(repo)
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT * FROM devin_sessions WHERE repo = ? ORDER BY created_at DESC",
-            (resolved_repo,),
+    cursor = await db.execute(
+        "SELECT * FROM devin_sessions WHERE repo = ? ORDER BY created_at DESC",
+        (resolved_repo,),
+    )
+    rows = await cursor.fetchall()
+
+    return [
+        DevinSession.model_construct(
+            id=row["id"],
+            session_id=row["session_id"],
+            alert_number=row["alert_number"],
+            rule_id=row["rule_id"],
+            file_path=row["file_path"],
+            status=row["status"],
+            pr_url=row["pr_url"],
+            acus=row["acus"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
         )
-        rows = await cursor.fetchall()
-
-        return [
-            DevinSession(
-                id=row["id"],
-                session_id=row["session_id"],
-                alert_number=row["alert_number"],
-                rule_id=row["rule_id"],
-                file_path=row["file_path"],
-                status=row["status"],
-                pr_url=row["pr_url"],
-                acus=row["acus"] if "acus" in row.keys() else None,
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            )
-            for row in rows
-        ]
-    finally:
-        await db.close()
+        for row in rows
+    ]
 
 
-@router.post("/api-tool", response_model=ApiRemediationResponse)
+@router.post("/api-tool", response_model=ApiRemediationResponse, status_code=202)
 async def trigger_api_remediation(
     request: ApiRemediationRequest,
+    background_tasks: BackgroundTasks,
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
+    settings: Settings = Depends(get_settings),
 ) -> ApiRemediationResponse:
     """Trigger remediation using an API-based tool (Anthropic, OpenAI, or Google).
 
@@ -335,6 +372,10 @@ async def trigger_api_remediation(
     2. Build a single remediation prompt with all alerts for that file
     3. Call the LLM API to generate a fix addressing all alerts at once
     4. Commit the fixed file back via GitHub Contents API (one commit per file)
+
+    Alerts are triaged and queued as ``pending`` jobs before responding; the
+    per-file work runs as a background task. Poll ``GET /api-tool/jobs`` for
+    progress.
     """
     tool = request.tool
     if tool not in _API_TOOL_CONFIG:
@@ -355,16 +396,18 @@ async def trigger_api_remediation(
     resolved_repo = await resolve_repo(repo)
     baseline_branch = await resolve_baseline_branch(resolved_repo)
 
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
 
-    # Fetch open alerts from baseline branch
-    alerts = await github.get_alerts(baseline_branch, state="open")
+    # Fetch open alerts from baseline while creating a fresh branch for this run
+    branch_name = f"remediate/{tool}-{next(_branch_counter)}"
+    alerts = await _open_alerts_with_branch(github, baseline_branch, branch_name)
 
     # Filter to requested alert numbers
     requested_set = set(request.alert_numbers)
     alerts = [a for a in alerts if a.number in requested_set]
 
     if not alerts:
+        await _discard_branch(github, branch_name)
         return ApiRemediationResponse(
             tool=tool,
             total_alerts=0,
@@ -375,23 +418,13 @@ async def trigger_api_remediation(
             message="No matching open alerts found",
         )
 
-    # Create a fresh branch from main for this remediation run
-    branch_name = f"remediate/{tool}-{int(__import__('time').time())}"
-    try:
-        await github.create_branch(branch_name, from_branch=baseline_branch)
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create branch {branch_name}: {e}",
-        ) from e
-
     # Group alerts by file to avoid conflicts
     file_groups = _group_alerts_by_file(alerts)
 
     # Start replay recording with the new branch
     recorder = ReplayRecorder(tools=[tool], branch_name=branch_name, repo=resolved_repo)
     await recorder.start()
-    await recorder.record(
+    recorder.record(
         tool=tool,
         event_type="scan_started",
         detail=(
@@ -411,27 +444,29 @@ async def trigger_api_remediation(
 
     db = await get_db()
     jobs: list[ApiRemediationJob] = []
-    completed = 0
-    failed = 0
     skipped = 0
 
     try:
+        # Find alerts that already have a successful job in one query
+        cursor = await db.execute(
+            """SELECT alert_number FROM api_remediation_jobs
+               WHERE repo = ? AND tool = ? AND alert_number IN (SELECT value FROM json_each(?))
+               AND status = 'completed'""",
+            (resolved_repo, tool, json.dumps([a.number for a in alerts])),
+        )
+        completed_nums = {row["alert_number"] for row in await cursor.fetchall()}
+
+        # Partition each file group into already-remediated and new alerts
+        pending_groups: list[tuple[str, list[Alert], list[int]]] = []
         for file_path, file_alerts in file_groups.items():
             alert_nums = [a.number for a in file_alerts]
 
             # Skip alerts that already have a successful job
             new_alerts: list[Alert] = []
             for alert in file_alerts:
-                cursor = await db.execute(
-                    "SELECT * FROM api_remediation_jobs "
-                    "WHERE repo = ? AND tool = ? AND alert_number = ? "
-                    "AND status = 'completed'",
-                    (resolved_repo, tool, alert.number),
-                )
-                existing = await cursor.fetchone()
-                if existing:
+                if alert.number in completed_nums:
                     logger.info("Skipping alert %d for %s — already remediated", alert.number, tool)
-                    await recorder.record(
+                    recorder.record(
                         tool=tool,
                         event_type="alert_skipped",
                         detail=f"Alert #{alert.number} already remediated by {tool}",
@@ -446,258 +481,327 @@ async def trigger_api_remediation(
                 else:
                     new_alerts.append(alert)
 
-            if not new_alerts:
-                continue
-
-            # Insert pending job rows for all alerts in this file group
-            job_ids: list[int] = []
-            for alert in new_alerts:
-                cursor = await db.execute(
-                    """INSERT INTO api_remediation_jobs (repo, tool, alert_number, rule_id, file_path, status)
-                       VALUES (?, ?, ?, ?, ?, 'running')""",
-                    (resolved_repo, tool, alert.number, alert.rule_id, alert.file_path),
-                )
-                job_ids.append(cursor.lastrowid or 0)
+            if new_alerts:
+                pending_groups.append((file_path, new_alerts, alert_nums))
+
+        # Queue a pending job row for every alert that still needs a fix
+        job_ids_by_num: dict[int, int] = {}
+        queued = [a for _, new_alerts, _ in pending_groups for a in new_alerts]
+        if queued:
+            values = ", ".join(["(?, ?, ?, ?, ?, 'pending')"] * len(queued))
+            rows = await db.execute_fetchall(
+                f"""INSERT INTO api_remediation_jobs (repo, tool, alert_number, rule_id, file_path, status)
+                    VALUES {values} RETURNING id, alert_number""",
+                [p for a in queued for p in (resolved_repo, tool, a.number, a.rule_id, a.file_path)],
+            )
+            job_ids_by_num = {row["alert_number"]: row["id"] for row in rows}
             await db.commit()
 
-            try:
-                # 1. Fetch source file
-                await recorder.record(
-                    tool=tool,
-                    event_type="alert_triaged",
-                    detail=(
-                        f"Fetching {file_path} for {len(new_alerts)} alert(s): "
-                        f"{', '.join(f'#{a.number}' for a in new_alerts)}"
-                    ),
-                    alert_number=new_alerts[0].number,
-                    metadata={
-                        "file_path": file_path,
-                        "alert_count": len(new_alerts),
-                        "alert_numbers": [a.number for a in new_alerts],
-                        "rules": [a.rule_id for a in new_alerts],
-                        "severities": [a.severity for a in new_alerts],
-                    },
+        # Fetch all jobs for the requested alerts (new pending ones included)
+        cursor = await db.execute(
+            """SELECT * FROM api_remediation_jobs
+               WHERE repo = ? AND tool = ? AND alert_number IN (SELECT value FROM json_each(?))
+               ORDER BY created_at DESC""",
+            (resolved_repo, tool, json.dumps(request.alert_numbers)),
+        )
+        rows = await cursor.fetchall()
+        jobs = [
+            ApiRemediationJob.model_construct(
+                id=row["id"],
+                tool=row["tool"],
+                alert_number=row["alert_number"],
+                rule_id=row["rule_id"],
+                file_path=row["file_path"],
+                status=row["status"],
+                commit_sha=row["commit_sha"],
+                error_message=row["error_message"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+            for row in rows
+        ]
+    except Exception:
+        await recorder.finish("failed")
+        raise
+
+    background_tasks.add_task(
+        _run_api_remediation,
+        tool=tool,
+        resolved_repo=resolved_repo,
+        branch_name=branch_name,
+        recorder=recorder,
+        groups=[
+            (file_path, new_alerts, alert_nums, [job_ids_by_num[a.number] for a in new_alerts])
+            for file_path, new_alerts, alert_nums in pending_groups
+        ],
+        total_alerts=len(alerts),
+        file_count=len(file_groups),
+        skipped=skipped,
+        concurrency=settings.api_remediation_concurrency,
+    )
+
+    return ApiRemediationResponse(
+        tool=tool,
+        total_alerts=len(alerts),
+        completed=0,
+        failed=0,
+        skipped=skipped,
+        jobs=jobs,
+        message=(
+            f"Remediation started on {branch_name}: {len(queued)} alert(s) "
+            f"across {len(pending_groups)} file(s) queued, {skipped} skipped"
+        ),
+    )
+
+
+async def _run_api_remediation(
+    tool: str,
+    resolved_repo: str,
+    branch_name: str,
+    recorder: ReplayRecorder,
+    groups: list[tuple[str, list[Alert], list[int], list[int]]],
+    total_alerts: int,
+    file_count: int,
+    skipped: int,
+    concurrency: int,
+) -> None:
+    """Remediate queued API-tool file groups (runs after the response is sent).
+
+    ``groups`` holds (file_path, alerts to fix, all alert numbers in the file,
+    pending job ids) per file.
+    """
+    github = get_github_client(resolved_repo)
+    db = await get_db()
+
+    try:
+        # Files are independent, so fetch/prompt/LLM work runs concurrently.
+        # Commits stay serialized: the Contents API rejects concurrent
+        # commits to the same branch.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        commit_lock = asyncio.Lock()
+
+        async def _process_file(
+            file_path: str, new_alerts: list[Alert], alert_nums: list[int], job_ids: list[int],
+        ) -> tuple[int, int]:
+            """Remediate one file group; returns (completed, failed) alert counts."""
+            new_alert_nums = [a.number for a in new_alerts]
+            new_rule_ids = [a.rule_id for a in new_alerts]
+            new_severities = [a.severity for a in new_alerts]
+            alert_refs = ", ".join(f"#{n}" for n in new_alert_nums)
+
+            async with semaphore:
+                await db.execute(
+                    """UPDATE api_remediation_jobs
+                       SET status = 'running', updated_at = datetime('now')
+                       WHERE id IN (SELECT value FROM json_each(?))""",
+                    (json.dumps(job_ids),),
                 )
-                file_content = await github.get_file_content(file_path, branch_name)
+                await db.commit()
 
-                # 2. Build prompt — grouped if multiple alerts, single otherwise
-                if len(new_alerts) == 1:
-                    alert = new_alerts[0]
-                    prompt = build_prompt_for_alert(
-                        alert_rule_id=alert.rule_id,
-                        alert_severity=alert.severity,
-                        alert_rule_description=alert.rule_description,
-                        alert_message=alert.message,
-                        alert_file_path=alert.file_path,
-                        alert_start_line=alert.start_line,
-                        alert_end_line=alert.end_line,
-                        file_content=file_content,
-                    )
-                else:
-                    prompt = build_grouped_prompt_for_file(
-                        file_path=file_path,
-                        file_content=file_content,
-                        alerts=[
-                            {
-                                "rule_id": a.rule_id,
-                                "severity": a.severity,
-                                "rule_description": a.rule_description,
-                                "message": a.message,
-                                "start_line": a.start_line,
-                                "end_line": a.end_line,
-                            }
-                            for a in new_alerts
-                        ],
+                try:
+                    # 1. Fetch source file
+                    recorder.record(
+                        tool=tool,
+                        event_type="alert_triaged",
+                        detail=(
+                            f"Fetching {file_path} for {len(new_alerts)} alert(s): "
+                            f"{alert_refs}"
+                        ),
+                        alert_number=new_alerts[0].number,
+                        metadata={
+                            "file_path": file_path,
+                            "alert_count": len(new_alerts),
+                            "alert_numbers": new_alert_nums,
+                            "rules": new_rule_ids,
+                            "severities": new_severities,
+                        },
                     )
+                    file_content = await github.get_file_content(file_path, branch_name)
+
+                    # 2. Build prompt — grouped if multiple alerts, single otherwise
+                    if len(new_alerts) == 1:
+                        alert = new_alerts[0]
+                        prompt = build_prompt_for_alert(
+                            alert_rule_id=alert.rule_id,
+                            alert_severity=alert.severity,
+                            alert_rule_description=alert.rule_description,
+                            alert_message=alert.message,
+                            alert_file_path=alert.file_path,
+                            alert_start_line=alert.start_line,
+                            alert_end_line=alert.end_line,
+                            file_content=file_content,
+                        )
+                    else:
+                        prompt = build_grouped_prompt_for_file(
+                            file_path=file_path,
+                            file_content=file_content,
+                            alerts=[
+                                {
+                                    "rule_id": a.rule_id,
+                                    "severity": a.severity,
+                                    "rule_description": a.rule_description,
+                                    "message": a.message,
+                                    "start_line": a.start_line,
+                                    "end_line": a.end_line,
+                                }
+                                for a in new_alerts
+                            ],
+                        )
 
-                prompt_tokens = count_tokens(prompt)
+                    prompt_tokens = await count_tokens_async(prompt)
+                    prompt_preview = prompt[:500]
 
-                # 3. Call LLM (with inter-call delay for rate limiting)
-                logger.info(
-                    "Calling %s for %d alert(s) in %s",
-                    tool, len(new_alerts), file_path,
-                )
+                    # 3. Call LLM (with inter-call delay for rate limiting)
+                    logger.info(
+                        "Calling %s for %d alert(s) in %s",
+                        tool, len(new_alerts), file_path,
+                    )
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="api_call_sent",
-                    detail=(
-                        f"Sending {len(new_alerts)} grouped alert(s) for "
-                        f"{file_path} to {tool}"
-                    ),
-                    alert_number=new_alerts[0].number,
-                    metadata={
-                        "prompt_tokens": prompt_tokens,
-                        "prompt_preview": prompt[:500],
-                        "source_file_length": len(file_content),
-                        "file_path": file_path,
-                        "alert_count": len(new_alerts),
-                        "alert_numbers": [a.number for a in new_alerts],
-                    },
-                )
+                    recorder.record(
+                        tool=tool,
+                        event_type="api_call_sent",
+                        detail=(
+                            f"Sending {len(new_alerts)} grouped alert(s) for "
+                            f"{file_path} to {tool}"
+                        ),
+                        alert_number=new_alerts[0].number,
+                        metadata={
+                            "prompt_tokens": prompt_tokens,
+                            "prompt_preview": prompt_preview,
+                            "source_file_length": len(file_content),
+                            "file_path": file_path,
+                            "alert_count": len(new_alerts),
+                            "alert_numbers": new_alert_nums,
+                        },
+                    )
 
-                llm_result = await call_llm_with_delay(tool, prompt)
+                    llm_result = await call_llm_with_delay(tool, prompt)
 
-                if not llm_result.extracted_code or not llm_result.extracted_code.strip():
-                    raise ValueError("LLM returned empty response")
+                    if not llm_result.extracted_code or not llm_result.extracted_code.strip():
+                        raise ValueError("LLM returned empty response")
 
-                # Compute cost for this LLM call
-                call_cost = compute_llm_call_cost(
-                    tool, llm_result.input_tokens, llm_result.output_tokens,
-                )
+                    # Compute cost for this LLM call
+                    call_cost = compute_llm_call_cost(
+                        tool, llm_result.input_tokens, llm_result.output_tokens,
+                    )
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="patch_generated",
-                    detail=(
-                        f"{llm_result.model} generated fix for "
-                        f"{len(new_alerts)} alert(s) in {file_path}"
-                    ),
-                    alert_number=new_alerts[0].number,
-                    metadata={
-                        "model": llm_result.model,
-                        "latency_ms": llm_result.latency_ms,
-                        "input_tokens": llm_result.input_tokens,
-                        "output_tokens": llm_result.output_tokens,
-                        "fixed_content_length": len(llm_result.extracted_code),
-                        "source_file_length": len(file_content),
-                        "file_path": file_path,
-                        "alert_count": len(new_alerts),
-                    },
-                    cost_usd=call_cost,
-                )
+                    recorder.record(
+                        tool=tool,
+                        event_type="patch_generated",
+                        detail=(
+                            f"{llm_result.model} generated fix for "
+                            f"{len(new_alerts)} alert(s) in {file_path}"
+                        ),
+                        alert_number=new_alerts[0].number,
+                        metadata={
+                            "model": llm_result.model,
+                            "latency_ms": llm_result.latency_ms,
+                            "input_tokens": llm_result.input_tokens,
+                            "output_tokens": llm_result.output_tokens,
+                            "fixed_content_length": len(llm_result.extracted_code),
+                            "source_file_length": len(file_content),
+                            "file_path": file_path,
+                            "alert_count": len(new_alerts),
+                        },
+                        cost_usd=call_cost,
+                    )
 
-                # 4. Commit the fix — one commit per file
-                alert_refs = ", ".join(f"#{a.number}" for a in new_alerts)
-                commit_msg = (
-                    f"fix: remediate {len(new_alerts)} CodeQL alert(s) "
-                    f"({alert_refs}) in {file_path} via {tool}"
-                )
-                commit_sha = await github.update_file_content(
-                    path=file_path,
-                    new_content=llm_result.extracted_code,
-                    branch=branch_name,
-                    commit_message=commit_msg,
-                )
+                    # 4. Commit the fix — one commit per file
+                    commit_msg = (
+                        f"fix: remediate {len(new_alerts)} CodeQL alert(s) "
+                        f"({alert_refs}) in {file_path} via {tool}"
+                    )
+                    async with commit_lock:
+                        commit_sha = await github.update_file_content(
+                            path=file_path,
+                            new_content=llm_result.extracted_code,
+                            branch=branch_name,
+                            commit_message=commit_msg,
+                        )
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="patch_applied",
-                    detail=f"Patch committed to {branch_name} for {file_path}",
-                    alert_number=new_alerts[0].number,
-                    metadata={
-                        "commit_sha": commit_sha,
-                        "branch": branch_name,
-                        "file_path": file_path,
-                        "commit_message": commit_msg,
-                        "alert_numbers": [a.number for a in new_alerts],
-                    },
-                )
+                    recorder.record(
+                        tool=tool,
+                        event_type="patch_applied",
+                        detail=f"Patch committed to {branch_name} for {file_path}",
+                        alert_number=new_alerts[0].number,
+                        metadata={
+                            "commit_sha": commit_sha,
+                            "branch": branch_name,
+                            "file_path": file_path,
+                            "commit_message": commit_msg,
+                            "alert_numbers": new_alert_nums,
+                        },
+                    )
 
-                # 5. Update all job statuses for this file group
-                for jid in job_ids:
-                    await db.execute(
-                        """UPDATE api_remediation_jobs
-                           SET status = 'completed', commit_sha = ?, updated_at = datetime('now')
-                           WHERE id = ?""",
-                        (commit_sha, jid),
+                    # 5. Update all job statuses for this file group
+                    for jid in job_ids:
+                        await db.execute(
+                            """UPDATE api_remediation_jobs
+                               SET status = 'completed', commit_sha = ?, updated_at = datetime('now')
+                               WHERE id = ?""",
+                            (commit_sha, jid),
+                        )
+                    await db.commit()
+
+                    logger.info(
+                        "Successfully remediated %d alert(s) in %s via %s (commit %s)",
+                        len(new_alerts), file_path, tool,
+                        commit_sha[:8] if commit_sha else "unknown",
                     )
-                await db.commit()
-                completed += len(new_alerts)
+                    return len(new_alerts), 0
 
-                logger.info(
-                    "Successfully remediated %d alert(s) in %s via %s (commit %s)",
-                    len(new_alerts), file_path, tool,
-                    commit_sha[:8] if commit_sha else "unknown",
-                )
+                except Exception as e:
+                    error_msg = str(e)[:500]
+                    logger.exception("Failed to remediate file %s via %s", file_path, tool)
+                    for jid in job_ids:
+                        await db.execute(
+                            """UPDATE api_remediation_jobs
+                               SET status = 'failed', error_message = ?, updated_at = datetime('now')
+                               WHERE id = ?""",
+                            (error_msg, jid),
+                        )
+                    await db.commit()
 
-            except Exception as e:
-                error_msg = str(e)[:500]
-                logger.exception("Failed to remediate file %s via %s", file_path, tool)
-                for jid in job_ids:
-                    await db.execute(
-                        """UPDATE api_remediation_jobs
-                           SET status = 'failed', error_message = ?, updated_at = datetime('now')
-                           WHERE id = ?""",
-                        (error_msg, jid),
+                    recorder.record(
+                        tool=tool,
+                        event_type="error",
+                        detail=f"Failed to remediate {file_path}: {error_msg[:200]}",
+                        alert_number=new_alerts[0].number,
+                        metadata={
+                            "error": error_msg,
+                            "file_path": file_path,
+                            "alert_numbers": alert_nums,
+                        },
                     )
-                await db.commit()
-                failed += len(new_alerts)
+                    return 0, len(new_alerts)
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="error",
-                    detail=f"Failed to remediate {file_path}: {error_msg[:200]}",
-                    alert_number=new_alerts[0].number,
-                    metadata={
-                        "error": error_msg,
-                        "file_path": file_path,
-                        "alert_numbers": alert_nums,
-                    },
-                )
+        results = await asyncio.gather(*(_process_file(*group) for group in groups))
+        completed = sum(c for c, _ in results)
+        failed = sum(f for _, f in results)
 
         # Record completion summary
-        await recorder.record(
+        recorder.record(
             tool=tool,
             event_type="remediation_complete",
             detail=(
                 f"Remediation complete on {branch_name}: {completed} fixed, "
-                f"{failed} failed, {skipped} skipped out of {len(alerts)} alerts "
-                f"across {len(file_groups)} files"
+                f"{failed} failed, {skipped} skipped out of {total_alerts} alerts "
+                f"across {file_count} files"
             ),
             metadata={
-                "total_alerts": len(alerts),
+                "total_alerts": total_alerts,
                 "completed": completed,
                 "failed": failed,
                 "skipped": skipped,
                 "tool": tool,
                 "branch": branch_name,
-                "file_count": len(file_groups),
+                "file_count": file_count,
             },
         )
         await recorder.finish()
-
-        # Fetch all jobs we created/touched for the response
-        cursor = await db.execute(
-            """SELECT * FROM api_remediation_jobs
-               WHERE repo = ? AND tool = ? AND alert_number IN ({})
-               ORDER BY created_at DESC""".format(",".join("?" * len(request.alert_numbers))),
-            (resolved_repo, tool, *request.alert_numbers),
-        )
-        rows = await cursor.fetchall()
-        jobs = [
-            ApiRemediationJob(
-                id=row["id"],
-                tool=row["tool"],
-                alert_number=row["alert_number"],
-                rule_id=row["rule_id"],
-                file_path=row["file_path"],
-                status=row["status"],
-                commit_sha=row["commit_sha"],
-                error_message=row["error_message"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            )
-            for row in rows
-        ]
-
-        return ApiRemediationResponse(
-            tool=tool,
-            total_alerts=len(alerts),
-            completed=completed,
-            failed=failed,
-            skipped=skipped,
-            jobs=jobs,
-            message=(
-                f"Remediation complete on {branch_name}: "
-                f"{completed} fixed, {failed} failed, {skipped} skipped"
-            ),
-        )
     except Exception:
+        logger.exception("%s remediation on %s failed", tool, branch_name)
         await recorder.finish("failed")
-        raise
-    finally:
-        await db.close()
 
 
 @router.get("/api-tool/jobs", response_model=list[ApiRemediationJob])
@@ -708,101 +812,118 @@ async def list_api_remediation_jobs(
     """List API remediation jobs for a repo, optionally filtered by tool."""
     resolved_repo = await resolve_repo(repo)
     db = await get_db()
-    try:
-        if tool:
-            cursor = await db.execute(
-                "SELECT * FROM api_remediation_jobs WHERE repo = ? AND tool = ? ORDER BY created_at DESC",
-                (resolved_repo, tool),
-            )
-        else:
-            cursor = await db.execute(
-                "SELECT * FROM api_remediation_jobs WHERE repo = ? ORDER BY created_at DESC",
-                (resolved_repo,),
-            )
-        rows = await cursor.fetchall()
-        return [
-            ApiRemediationJob(
-                id=row["id"],
-                tool=row["tool"],
-                alert_number=row["alert_number"],
-                rule_id=row["rule_id"],
-                file_path=row["file_path"],
-                status=row["status"],
-                commit_sha=row["commit_sha"],
-                error_message=row["error_message"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            )
-            for row in rows
-        ]
-    finally:
-        await db.close()
+    if tool:
+        cursor = await db.execute(
+            "SELECT * FROM api_remediation_jobs WHERE repo = ? AND tool = ? ORDER BY created_at DESC",
+            (resolved_repo, tool),
+        )
+    else:
+        cursor = await db.execute(
+            "SELECT * FROM api_remediation_jobs WHERE repo = ? ORDER BY created_at DESC",
+            (resolved_repo,),
+        )
+    rows = await cursor.fetchall()
+    return [
+        ApiRemediationJob.model_construct(
+            id=row["id"],
+            tool=row["tool"],
+            alert_number=row["alert_number"],
+            rule_id=row["rule_id"],
+            file_path=row["file_path"],
+            status=row["status"],
+            commit_sha=row["commit_sha"],
+            error_message=row["error_message"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+        for row in rows
+    ]
+
+
+DEVIN_REFRESH_RATE = 5  # single-session status calls per second on refresh
 
 
 @router.post("/devin/refresh")
 async def refresh_devin_sessions(
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
+    settings: Settings = Depends(get_settings),
 ) -> dict:
     """Refresh status of running Devin sessions for a repo."""
     if not settings.devin_api_key or not settings.devin_org_id:
         raise HTTPException(status_code=400, detail="DEVIN_API_KEY and DEVIN_ORG_ID must be configured")
 
-    devin = DevinClient()
+    devin = get_devin_client()
     db = await get_db()
-    updated_count = 0
 
+    resolved_repo = await resolve_repo(repo)
+    cursor = await db.execute(
+        "SELECT * FROM devin_sessions WHERE repo = ? AND status = 'running'",
+        (resolved_repo,),
+    )
+    rows = await cursor.fetchall()
+
+    if not rows:
+        return {"updated": 0, "total_running": 0}
+
+    # Look sessions up in the org-wide index (includes status_detail, shared
+    # with benchmark pollers) rather than hitting the single-session
+    # endpoint per row.
     try:
-        resolved_repo = await resolve_repo(repo)
-        cursor = await db.execute(
-            "SELECT * FROM devin_sessions WHERE repo = ? AND status = 'running'",
-            (resolved_repo,),
+        org_sessions_by_id = await devin.get_sessions_by_id()
+    except Exception:
+        logger.exception("Failed to list org sessions, falling back to per-session polling")
+        org_sessions_by_id = {}
+
+    # Fallback to the single-session endpoint for anything the list missed,
+    # fetched concurrently (one call per session, rate limited). Kept apart
+    # from the index, which is a shared cache.
+    fallback_by_id: dict[str, dict] = {}
+    missing = list({row["session_id"] for row in rows} - org_sessions_by_id.keys())
+    if missing:
+        limiter = AsyncRateLimiter(max_rate=DEVIN_REFRESH_RATE, time_period=1.0)
+
+        async def _fetch_status(sid: str) -> dict:
+            async with limiter:
+                return await devin.get_session_status(sid)
+
+        fetched = await asyncio.gather(
+            *(_fetch_status(sid) for sid in missing), return_exceptions=True,
         )
-        rows = await cursor.fetchall()
-
-        if not rows:
-            return {"updated": 0, "total_running": 0}
+        for sid, result in zip(missing, fetched):
+            if isinstance(result, BaseException):
+                logger.error("Failed to refresh session %s", sid, exc_info=result)
+            else:
+                fallback_by_id[sid] = result
 
-        # Fetch all org sessions once (includes status_detail) rather
-        # than hitting the single-session endpoint per row.
+    updates: list[tuple] = []
+    for row in rows:
         try:
-            all_org_sessions = await devin.list_sessions()
-            org_sessions_by_id = {
-                s["session_id"]: s for s in all_org_sessions
-            }
-        except Exception:
-            logger.exception("Failed to list org sessions, falling back to per-session polling")
-            org_sessions_by_id = {}
-
-        for row in rows:
-            try:
-                sid = row["session_id"]
-                status_data = org_sessions_by_id.get(sid)
-                if status_data is None:
-                    # Fallback to single-session endpoint
-                    status_data = await devin.get_session_status(sid)
+            sid = row["session_id"]
+            status_data = org_sessions_by_id.get(sid) or fallback_by_id.get(sid)
+            if status_data is None:
+                continue
 
-                # Use _is_devin_session_done to also detect waiting_for_user
-                _done, effective_status = _is_devin_session_done(status_data)
-                new_status = effective_status if _done else status_data.get("status", "unknown")
+            # Use _is_devin_session_done to also detect waiting_for_user
+            _done, effective_status = _is_devin_session_done(status_data)
+            new_status = effective_status if _done else status_data.get("status", "unknown")
 
-                prs = status_data.get("pull_requests", [])
-                pr_url = prs[0].get("pr_url") if prs else None
-                acus = status_data.get("acus_consumed")
+            prs = status_data.get("pull_requests", [])
+            pr_url = prs[0].get("pr_url") if prs else None
+            acus = status_data.get("acus_consumed")
 
-                await db.execute(
-                    """UPDATE devin_sessions
-                       SET status = ?, pr_url = ?, acus = COALESCE(?, acus), updated_at = datetime('now')
-                       WHERE repo = ? AND session_id = ? AND file_path = ?""",
-                    (new_status, pr_url, acus, row["repo"], sid, row["file_path"]),
-                )
-                updated_count += 1
-            except Exception:
-                logger.exception("Failed to refresh session %s", row["session_id"])
+            updates.append((new_status, pr_url, acus, row["repo"], sid, row["file_path"]))
+        except Exception:
+            logger.exception("Failed to refresh session %s", row["session_id"])
 
-        await db.commit()
-        return {"updated": updated_count, "total_running": len(rows)}
-    finally:
-        await db.close()
+    await db.executemany(
+        """UPDATE devin_sessions
+           SET status = ?, pr_url = ?, acus = COALESCE(?, acus), updated_at = datetime('now')
+           WHERE repo = ? AND session_id = ? AND file_path = ?""",
+        updates,
+    )
+    updated_count = len(updates)
+    await db.commit()
+    return {"updated": updated_count, "total_running": len(rows)}
 
 
 # ---------------------------------------------------------------------------
@@ -810,19 +931,46 @@ async def refresh_devin_sessions(
 # ---------------------------------------------------------------------------
 
 COPILOT_INTER_ALERT_DELAY = 2.0  # seconds between trigger calls
+COPILOT_BENCHMARK_CONCURRENCY = 4  # alerts in flight at once per benchmark run
+
+# Autofix response fields kept in replay metadata
+_AUTOFIX_RAW_KEYS = ("status", "description", "started_at")
+
+
+def _autofix_raw(autofix: dict) -> dict:
+    """Trim an autofix response to the fields shown in the replay log."""
+    return {k: autofix[k] for k in _AUTOFIX_RAW_KEYS if k in autofix}
+
+
+def _copilot_job_from_row(row: dict) -> CopilotAutofixJob:
+    """Build a CopilotAutofixJob from a copilot_autofix_jobs row."""
+    return CopilotAutofixJob.model_construct(
+        id=row["id"],
+        alert_number=row["alert_number"],
+        rule_id=row["rule_id"],
+        file_path=row["file_path"],
+        status=row["status"],
+        autofix_status=row["autofix_status"],
+        commit_sha=row["commit_sha"],
+        description=row["description"],
+        error_message=row["error_message"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
 
 
 @router.post("/copilot", response_model=CopilotAutofixResponse)
 async def trigger_copilot_remediation(
     request: CopilotAutofixRequest,
     repo: str | None = Query(default=None, description="Repository (owner/repo)"),
+    settings: Settings = Depends(get_settings),
 ) -> CopilotAutofixResponse:
     """Trigger remediation using GitHub Copilot Autofix.
 
     Alerts are processed in batches of ``request.batch_size`` (default 10).
-    Within each batch alerts are handled sequentially with a short delay
-    between triggers to respect GitHub rate limits.  Between batches a
-    longer pause is applied so we don't overwhelm the API.
+    Within each batch alerts are handled concurrently, with trigger calls
+    rate limited to respect GitHub rate limits.  Calls that are throttled
+    anyway (429 / secondary rate limit) back off and retry.
 
     For each alert:
     1. Trigger Copilot Autofix generation via the REST API
@@ -838,12 +986,12 @@ async def trigger_copilot_remediation(
 
     # Use request override if provided, otherwise fall back to env var
     batch_size = max(1, request.batch_size or settings.batch_size)
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
 
-    # Fetch open alerts from baseline branch
-    alerts = await github.get_alerts(baseline_branch, state="open")
-    requested_set = set(request.alert_numbers)
-    alerts = [a for a in alerts if a.number in requested_set]
+    # Fetch only the requested open alerts from the baseline branch
+    alerts = await github.get_alerts(
+        baseline_branch, state="open", numbers=request.alert_numbers,
+    )
 
     if not alerts:
         return CopilotAutofixResponse(
@@ -867,7 +1015,7 @@ async def trigger_copilot_remediation(
     ]
 
     # Create a fresh branch from main
-    branch_name = f"remediate/copilot-{int(_time.time())}"
+    branch_name = f"remediate/copilot-{next(_branch_counter)}"
     try:
         await github.create_branch(
             branch_name, from_branch=baseline_branch,
@@ -881,7 +1029,7 @@ async def trigger_copilot_remediation(
     # Start replay recording
     recorder = ReplayRecorder(tools=["copilot"], branch_name=branch_name, repo=resolved_repo)
     await recorder.start()
-    await recorder.record(
+    recorder.record(
         tool="copilot",
         event_type="scan_started",
         detail=(
@@ -910,197 +1058,224 @@ async def trigger_copilot_remediation(
     recorder_finished = False
 
     try:
-        for batch_num, file_batch in enumerate(file_batches):
-            # Pause between batches (not before the first)
-            if batch_num > 0:
-                batch_delay = COPILOT_INTER_ALERT_DELAY * 2
-                logger.info(
-                    "Batch %d/%d complete, pausing %.1fs before next batch",
-                    batch_num, len(file_batches), batch_delay,
-                )
-                await recorder.record(
-                    tool="copilot",
-                    event_type="batch_pause",
-                    detail=(
-                        f"Batch {batch_num}/{len(file_batches)} done — "
-                        f"pausing {batch_delay:.0f}s before batch {batch_num + 1}"
-                    ),
-                    metadata={
-                        "batch_num": batch_num,
-                        "total_batches": len(file_batches),
-                        "delay_seconds": batch_delay,
-                    },
-                )
-                await asyncio.sleep(batch_delay)
-
-            for file_path, file_alerts in file_batch:
-                for alert_idx, alert in enumerate(file_alerts):
-                    # Rate-limit: wait between triggers (skip for the very first)
-                    if batch_num > 0 or file_path != file_batch[0][0] or alert_idx > 0:
-                        await asyncio.sleep(COPILOT_INTER_ALERT_DELAY)
-
-                    # Check if already processed
-                    cursor = await db.execute(
-                        "SELECT * FROM copilot_autofix_jobs "
-                        "WHERE repo = ? AND alert_number = ? "
-                        "AND status = 'completed'",
-                        (resolved_repo, alert.number),
+        # Alerts in a batch run concurrently; the limiter keeps trigger calls
+        # spaced COPILOT_INTER_ALERT_DELAY apart and commits to the branch
+        # stay serialized.
+        semaphore = asyncio.Semaphore(batch_size)
+        limiter = AsyncRateLimiter(max_rate=1, time_period=COPILOT_INTER_ALERT_DELAY)
+        commit_lock = asyncio.Lock()
+
+        # Final job statuses, written once per batch:
+        # (autofix_status, commit_sha, description, id) and
+        # (autofix_status, error_message, id)
+        completed_updates: list[tuple[str, str, str, int]] = []
+        failed_updates: list[tuple[str | None, str, int]] = []
+
+        async def _process_alert(file_path: str, alert: Alert, job_id: int) -> str:
+            """Autofix one alert; returns "completed" or "failed"."""
+            async with semaphore:
+                try:
+                    # 1. Trigger autofix (rate limited) + poll
+                    await limiter.acquire()
+                    recorder.record(
+                        tool="copilot",
+                        event_type="autofix_triggered",
+                        detail=(
+                            f"Triggering Copilot Autofix for alert #{alert.number} "
+                            f"({alert.rule_id}) in {file_path}"
+                        ),
+                        alert_number=alert.number,
+                        metadata={
+                            "rule_id": alert.rule_id,
+                            "file_path": alert.file_path,
+                            "severity": alert.severity,
+                        },
+                        cost_usd=COPILOT_COST_PER_REQUEST,
                     )
-                    existing = await cursor.fetchone()
-                    if existing:
-                        logger.info(
-                            "Skipping alert #%d — already remediated by Copilot",
-                            alert.number,
+
+                    autofix = await github.poll_autofix(alert.number)
+                    autofix_status = autofix.get("status", "unknown")
+                    description = autofix.get("description", "")
+                    autofix_raw = _autofix_raw(autofix)
+
+                    recorder.record(
+                        tool="copilot",
+                        event_type="autofix_result",
+                        detail=f"Autofix for alert #{alert.number}: {autofix_status}",
+                        alert_number=alert.number,
+                        metadata={
+                            "autofix_status": autofix_status,
+                            "description": description,
+                            "rule_id": alert.rule_id,
+                            "file_path": alert.file_path,
+                            "raw_response": autofix_raw,
+                        },
+                    )
+
+                    if autofix_status not in ("succeeded", "success"):
+                        # Autofix didn't succeed — mark as failed
+                        failed_updates.append(
+                            (autofix_status, f"Autofix status: {autofix_status}", job_id),
                         )
-                        await recorder.record(
-                            tool="copilot",
-                            event_type="alert_skipped",
-                            detail=f"Alert #{alert.number} already remediated by Copilot",
-                            alert_number=alert.number,
-                            metadata={
-                                "rule_id": alert.rule_id,
-                                "file_path": alert.file_path,
-                                "reason": "already_completed",
-                            },
+                        return "failed"
+
+                    # 2. Commit the fix to our branch
+                    commit_msg = (
+                        f"fix: Copilot Autofix for alert #{alert.number} "
+                        f"({alert.rule_id}) in {alert.file_path}"
+                    )
+                    async with commit_lock:
+                        commit_result = await retry_on_rate_limit(
+                            lambda: github.commit_autofix(alert.number, branch_name, commit_msg),
                         )
-                        skipped += 1
-                        continue
+                    commit_sha = commit_result.get("sha", "")
 
-                    # Insert a pending job row
-                    cursor = await db.execute(
-                        """INSERT INTO copilot_autofix_jobs
-                           (repo, alert_number, rule_id, file_path, status)
-                           VALUES (?, ?, ?, ?, 'running')""",
-                        (resolved_repo, alert.number, alert.rule_id, alert.file_path),
+                    recorder.record(
+                        tool="copilot",
+                        event_type="patch_applied",
+                        detail=f"Copilot fix committed for alert #{alert.number}",
+                        alert_number=alert.number,
+                        metadata={
+                            "commit_sha": commit_sha,
+                            "branch": branch_name,
+                            "file_path": alert.file_path,
+                            "description": description,
+                            "raw_response": autofix_raw,
+                        },
                     )
-                    job_id = cursor.lastrowid or 0
-                    await db.commit()
 
-                    try:
-                        # 1. Trigger autofix + poll
-                        await recorder.record(
-                            tool="copilot",
-                            event_type="autofix_triggered",
-                            detail=(
-                                f"Triggering Copilot Autofix for alert #{alert.number} "
-                                f"({alert.rule_id}) in {file_path}"
-                            ),
-                            alert_number=alert.number,
-                            metadata={
-                                "rule_id": alert.rule_id,
-                                "file_path": alert.file_path,
-                                "severity": alert.severity,
-                            },
-                            cost_usd=COPILOT_COST_PER_REQUEST,
-                        )
+                    # 3. Update job status
+                    completed_updates.append((autofix_status, commit_sha, description, job_id))
 
-                        autofix = await github.poll_autofix(alert.number)
-                        autofix_status = autofix.get("status", "unknown")
-                        description = autofix.get("description", "")
+                    logger.info(
+                        "Copilot Autofix committed for alert #%d (commit %s)",
+                        alert.number,
+                        commit_sha[:8] if commit_sha else "unknown",
+                    )
+                    return "completed"
 
-                        await recorder.record(
-                            tool="copilot",
-                            event_type="autofix_result",
-                            detail=f"Autofix for alert #{alert.number}: {autofix_status}",
-                            alert_number=alert.number,
-                            metadata={
-                                "autofix_status": autofix_status,
-                                "description": description,
-                                "rule_id": alert.rule_id,
-                                "file_path": alert.file_path,
-                                "raw_response": autofix,
-                            },
-                        )
+                except Exception as e:
+                    error_msg = str(e)[:500]
+                    logger.exception(
+                        "Failed Copilot Autofix for alert #%d", alert.number,
+                    )
+                    failed_updates.append((None, error_msg, job_id))
 
-                        if autofix_status not in ("succeeded", "success"):
-                            # Autofix didn't succeed — mark as failed
-                            await db.execute(
-                                """UPDATE copilot_autofix_jobs
-                                   SET status = 'failed',
-                                       autofix_status = ?,
-                                       error_message = ?,
-                                       updated_at = datetime('now')
-                                   WHERE id = ?""",
-                                (autofix_status, f"Autofix status: {autofix_status}", job_id),
-                            )
-                            await db.commit()
-                            failed += 1
-                            continue
-
-                        # 2. Commit the fix to our branch
-                        commit_msg = (
-                            f"fix: Copilot Autofix for alert #{alert.number} "
-                            f"({alert.rule_id}) in {alert.file_path}"
-                        )
-                        commit_result = await github.commit_autofix(
-                            alert.number, branch_name, commit_msg,
-                        )
-                        commit_sha = commit_result.get("sha", "")
+                    recorder.record(
+                        tool="copilot",
+                        event_type="error",
+                        detail=f"Failed autofix for alert #{alert.number}: {error_msg[:200]}",
+                        alert_number=alert.number,
+                        metadata={
+                            "error": error_msg,
+                            "rule_id": alert.rule_id,
+                            "file_path": alert.file_path,
+                        },
+                    )
+                    return "failed"
 
-                        await recorder.record(
-                            tool="copilot",
-                            event_type="patch_applied",
-                            detail=f"Copilot fix committed for alert #{alert.number}",
-                            alert_number=alert.number,
-                            metadata={
-                                "commit_sha": commit_sha,
-                                "branch": branch_name,
-                                "file_path": alert.file_path,
-                                "description": description,
-                                "raw_response": autofix,
-                            },
-                        )
+        # Find alerts that already have a successful job in one query
+        cursor = await db.execute(
+            """SELECT * FROM copilot_autofix_jobs
+               WHERE repo = ? AND status = 'completed'
+               AND alert_number IN (SELECT value FROM json_each(?))
+               ORDER BY created_at DESC""",
+            (resolved_repo, json.dumps([a.number for a in alerts])),
+        )
+        completed_rows = await cursor.fetchall()
+        completed_nums = {row["alert_number"] for row in completed_rows}
 
-                        # 3. Update job status
-                        await db.execute(
-                            """UPDATE copilot_autofix_jobs
-                               SET status = 'completed',
-                                   autofix_status = ?,
-                                   commit_sha = ?,
-                                   description = ?,
-                                   updated_at = datetime('now')
-                               WHERE id = ?""",
-                            (autofix_status, commit_sha, description, job_id),
-                        )
-                        await db.commit()
-                        completed += 1
+        # Jobs created by this run, kept up to date in memory for the response
+        jobs_by_id: dict[int, CopilotAutofixJob] = {}
 
-                        logger.info(
-                            "Copilot Autofix committed for alert #%d (commit %s)",
-                            alert.number,
-                            commit_sha[:8] if commit_sha else "unknown",
-                        )
+        for file_batch in file_batches:
+            batch_alerts = [(fp, a) for fp, file_alerts in file_batch for a in file_alerts]
 
-                    except Exception as e:
-                        error_msg = str(e)[:500]
-                        logger.exception(
-                            "Failed Copilot Autofix for alert #%d", alert.number,
-                        )
-                        await db.execute(
-                            """UPDATE copilot_autofix_jobs
-                               SET status = 'failed',
-                                   error_message = ?,
-                                   updated_at = datetime('now')
-                               WHERE id = ?""",
-                            (error_msg, job_id),
-                        )
-                        await db.commit()
-                        failed += 1
-
-                        await recorder.record(
-                            tool="copilot",
-                            event_type="error",
-                            detail=f"Failed autofix for alert #{alert.number}: {error_msg[:200]}",
-                            alert_number=alert.number,
-                            metadata={
-                                "error": error_msg,
-                                "rule_id": alert.rule_id,
-                                "file_path": alert.file_path,
-                            },
-                        )
+            # Skip alerts that already have a successful job
+            to_fix: list[tuple[str, Alert]] = []
+            for file_path, alert in batch_alerts:
+                if alert.number not in completed_nums:
+                    to_fix.append((file_path, alert))
+                    continue
+                logger.info(
+                    "Skipping alert #%d — already remediated by Copilot",
+                    alert.number,
+                )
+                recorder.record(
+                    tool="copilot",
+                    event_type="alert_skipped",
+                    detail=f"Alert #{alert.number} already remediated by Copilot",
+                    alert_number=alert.number,
+                    metadata={
+                        "rule_id": alert.rule_id,
+                        "file_path": alert.file_path,
+                        "reason": "already_completed",
+                    },
+                )
+                skipped += 1
+            if not to_fix:
+                continue
+
+            # Insert the batch's running job rows with a single commit
+            values = ", ".join(["(?, ?, ?, ?, 'running')"] * len(to_fix))
+            rows = await db.execute_fetchall(
+                f"""INSERT INTO copilot_autofix_jobs (repo, alert_number, rule_id, file_path, status)
+                    VALUES {values} RETURNING *""",
+                [p for _, a in to_fix for p in (resolved_repo, a.number, a.rule_id, a.file_path)],
+            )
+            job_ids_by_num = {row["alert_number"]: row["id"] for row in rows}
+            await db.commit()
+            for row in rows:
+                jobs_by_id[row["id"]] = _copilot_job_from_row(row)
+
+            outcomes = await asyncio.gather(
+                *(_process_alert(fp, a, job_ids_by_num[a.number]) for fp, a in to_fix)
+            )
+            completed += outcomes.count("completed")
+            failed += outcomes.count("failed")
+
+            # Write the batch's final statuses with a single commit
+            await db.executemany(
+                """UPDATE copilot_autofix_jobs
+                   SET status = 'completed',
+                       autofix_status = ?,
+                       commit_sha = ?,
+                       description = ?,
+                       updated_at = datetime('now')
+                   WHERE id = ?""",
+                completed_updates,
+            )
+            await db.executemany(
+                """UPDATE copilot_autofix_jobs
+                   SET status = 'failed',
+                       autofix_status = COALESCE(?, autofix_status),
+                       error_message = ?,
+                       updated_at = datetime('now')
+                   WHERE id = ?""",
+                failed_updates,
+            )
+            await db.commit()
+
+            # Mirror the same updates onto the in-memory jobs
+            updated_at = _time.strftime("%Y-%m-%d %H:%M:%S", _time.gmtime())
+            for autofix_status, commit_sha, description, job_id in completed_updates:
+                job = jobs_by_id[job_id]
+                job.status = "completed"
+                job.autofix_status = autofix_status
+                job.commit_sha = commit_sha
+                job.description = description
+                job.updated_at = updated_at
+            for autofix_status, error_message, job_id in failed_updates:
+                job = jobs_by_id[job_id]
+                job.status = "failed"
+                job.autofix_status = autofix_status or job.autofix_status
+                job.error_message = error_message
+                job.updated_at = updated_at
+            completed_updates.clear()
+            failed_updates.clear()
 
         # Record completion summary
-        await recorder.record(
+        recorder.record(
             tool="copilot",
             event_type="remediation_complete",
             detail=(
@@ -1118,30 +1293,10 @@ async def trigger_copilot_remediation(
         await recorder.finish()
         recorder_finished = True
 
-        # Fetch all jobs for the response
-        placeholders = ",".join("?" * len(request.alert_numbers))
-        cursor = await db.execute(
-            f"""SELECT * FROM copilot_autofix_jobs
-                WHERE repo = ? AND alert_number IN ({placeholders})
-                ORDER BY created_at DESC""",
-            (resolved_repo, *tuple(request.alert_numbers)),
-        )
-        rows = await cursor.fetchall()
+        # This run's jobs (newest first), then the earlier successful ones
         jobs = [
-            CopilotAutofixJob(
-                id=row["id"],
-                alert_number=row["alert_number"],
-                rule_id=row["rule_id"],
-                file_path=row["file_path"],
-                status=row["status"],
-                autofix_status=row["autofix_status"],
-                commit_sha=row["commit_sha"],
-                description=row["description"],
-                error_message=row["error_message"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-            )
-            for row in rows
+            *reversed(jobs_by_id.values()),
+            *(_copilot_job_from_row(row) for row in completed_rows),
         ]
 
         return CopilotAutofixResponse(
@@ -1162,8 +1317,6 @@ async def trigger_copilot_remediation(
             except Exception:
                 logger.exception("Failed to mark replay run as failed")
         raise
-    finally:
-        await db.close()
 
 
 # ---------------------------------------------------------------------------
@@ -1177,19 +1330,74 @@ INTER_TOOL_DELAY = 1.0  # seconds between launching tool tasks (rate-limit frien
 # CodeQL readiness polling configuration
 CODEQL_POLL_INTERVAL = 30.0  # seconds between CodeQL readiness checks
 CODEQL_MAX_WAIT = 20 * 60  # 20 minutes max wait for CodeQL analysis
+CODEQL_POLL_CONCURRENCY = 4  # branches probed at once per readiness check
+BENCHMARK_BRANCH_CONCURRENCY = 5  # tool branches created at once per benchmark
 
 # Devin session polling configuration
-DEVIN_POLL_INTERVAL = 30.0  # seconds between Devin session status checks
+DEVIN_POLL_INTERVAL = 30.0  # max seconds between Devin session status checks
+# First poll delay; grows by DEVIN_POLL_BACKOFF per poll. Keep its jittered
+# minimum above the session index TTL in devin_client, or polls read a stale listing.
+DEVIN_POLL_INITIAL = 2.0
+DEVIN_POLL_BACKOFF = 1.5
 DEVIN_MAX_WAIT = 30 * 60   # 30 minutes max wait for a single Devin session
-DEVIN_TERMINAL_STATES = {"exit", "error", "suspended"}
+DEVIN_TERMINAL_STATES = frozenset({"exit", "error", "suspended"})
 # status_detail values that indicate the session is effectively done
 # (e.g. "waiting_for_user" means Devin finished its work and is waiting for
 # human input which won't come in an automated benchmark)
-DEVIN_TERMINAL_STATUS_DETAILS = {"waiting_for_user"}
+DEVIN_TERMINAL_STATUS_DETAILS = frozenset({"waiting_for_user"})
+
+# devin_sessions writes issued for every benchmark file group
+_INSERT_BENCH_SESSION_SQL = """INSERT OR IGNORE INTO devin_sessions
+   (repo, session_id, alert_number, rule_id, file_path, status)
+   VALUES (?, ?, ?, ?, ?, 'running')"""
+_FINISH_BENCH_SESSION_SQL = """UPDATE devin_sessions
+   SET status = ?, pr_url = COALESCE(?, pr_url),
+       acus = COALESCE(?, acus),
+       updated_at = datetime('now')
+   WHERE repo = ? AND session_id = ? AND file_path = ?"""
+
+# SQLite's current UTC time in the ISO-8601 form replay timestamps use
+_SQL_NOW_ISO = "strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')"
 
 # In-memory cancel events for running benchmarks (run_id -> asyncio.Event)
 _cancel_events: dict[int, asyncio.Event] = {}
 
+# How long tool tasks get to wind down after a cancel before being cancelled
+BENCHMARK_CANCEL_GRACE = 30.0
+
+
+async def _sleep_or_cancel(cancel_event: asyncio.Event | None, delay: float) -> bool:
+    """Sleep ``delay`` seconds, waking early if the run is cancelled.
+
+    Returns True if ``cancel_event`` was set before the delay elapsed.
+    """
+    if cancel_event is None:
+        await asyncio.sleep(delay)
+        return False
+    try:
+        await asyncio.wait_for(cancel_event.wait(), timeout=delay)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def _cancel_stragglers(
+    cancel_event: asyncio.Event, tasks: list[asyncio.Task[None]],
+) -> None:
+    """Once the run is cancelled, hard-cancel tool tasks that outlast the grace.
+
+    Tools stop cooperatively on ``cancel_event`` (recording the cancellation
+    and updating their rows), but one blocked in a long LLM or GitHub call
+    would otherwise hold the run open until that call returns.
+    """
+    await cancel_event.wait()
+    if not tasks:
+        return
+    _done, pending = await asyncio.wait(tasks, timeout=BENCHMARK_CANCEL_GRACE)
+    for task in pending:
+        logger.warning("Benchmark tool task %s still running after cancel, cancelling", task.get_name())
+        task.cancel()
+
 
 async def _benchmark_api_tool(
     tool: str,
@@ -1200,38 +1408,44 @@ async def _benchmark_api_tool(
     start_time: float | None = None,
     branch_name: str | None = None,
     cancel_event: asyncio.Event | None = None,
+    file_groups: Mapping[str, list[Alert]] | None = None,
 ) -> None:
-    """Background task: run API-tool remediation and record to shared run."""
+    """Background task: run API-tool remediation and record to shared run.
+
+    ``file_groups`` may be passed in when the caller has already grouped
+    ``alerts`` by file (the benchmark shares one grouping across tools).
+    """
     key_attr = _API_TOOL_CONFIG.get(tool)
     if not key_attr or not getattr(settings, key_attr, None):
         recorder = await ReplayRecorder.attach(run_id, [tool], resolved_repo, start_time=start_time)
-        await recorder.record(
+        recorder.record(
             tool=tool,
             event_type="error",
             detail=f"{tool} API key not configured — skipping",
         )
         return
 
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
 
     # Use pre-created branch if provided, otherwise create one (legacy path)
     if branch_name is None:
-        branch_name = f"remediate/{tool}-bench-{int(_time.time())}"
+        branch_name = f"remediate/{tool}-bench-{next(_branch_counter)}"
         try:
             await github.create_branch(branch_name, from_branch=baseline_branch)
         except Exception as e:
             recorder = await ReplayRecorder.attach(run_id, [tool], resolved_repo, start_time=start_time)
-            await recorder.record(
+            recorder.record(
                 tool=tool,
                 event_type="error",
                 detail=f"Failed to create branch {branch_name}: {e}",
             )
             return
 
-    file_groups = _group_alerts_by_file(alerts)
+    if file_groups is None:
+        file_groups = _group_alerts_by_file(alerts)
 
     recorder = await ReplayRecorder.attach(run_id, [tool], resolved_repo, start_time=start_time)
-    await recorder.record(
+    recorder.record(
         tool=tool,
         event_type="scan_started",
         detail=(
@@ -1248,142 +1462,155 @@ async def _benchmark_api_tool(
         },
     )
 
-    db = await get_db()
-    completed = 0
-    failed = 0
+    try:
+        # File groups run concurrently like the API remediation endpoint;
+        # commits stay serialized since the Contents API rejects concurrent
+        # commits to the same branch.
+        semaphore = asyncio.Semaphore(max(1, settings.api_remediation_concurrency))
+        commit_lock = asyncio.Lock()
+
+        async def _process_file(file_path: str, file_alerts: list[Alert]) -> tuple[int, int] | None:
+            """Remediate one file group; returns (completed, failed), or None if cancelled."""
+            async with semaphore:
+                # Check for cancellation before each file group
+                if cancel_event and cancel_event.is_set():
+                    return None
+
+                try:
+                    recorder.record(
+                        tool=tool,
+                        event_type="alert_triaged",
+                        detail=f"Fetching {file_path} for {len(file_alerts)} alert(s)",
+                        alert_number=file_alerts[0].number,
+                        metadata={
+                            "file_path": file_path,
+                            "alert_count": len(file_alerts),
+                            "alert_numbers": [a.number for a in file_alerts],
+                        },
+                    )
+                    file_content = await github.get_file_content(file_path, branch_name)
 
-    try:
-        for file_path, file_alerts in file_groups.items():
-            # Check for cancellation before each file group
-            if cancel_event and cancel_event.is_set():
-                await recorder.record(
-                    tool=tool,
-                    event_type="cancelled",
-                    detail=f"{tool} cancelled after {completed} fixed, {failed} failed",
-                    metadata={"completed": completed, "failed": failed},
-                )
-                break
+                    # Build prompt
+                    if len(file_alerts) == 1:
+                        alert = file_alerts[0]
+                        prompt = build_prompt_for_alert(
+                            alert_rule_id=alert.rule_id,
+                            alert_severity=alert.severity,
+                            alert_rule_description=alert.rule_description,
+                            alert_message=alert.message,
+                            alert_file_path=alert.file_path,
+                            alert_start_line=alert.start_line,
+                            alert_end_line=alert.end_line,
+                            file_content=file_content,
+                        )
+                    else:
+                        prompt = build_grouped_prompt_for_file(
+                            file_path=file_path,
+                            file_content=file_content,
+                            alerts=[
+                                {
+                                    "rule_id": a.rule_id,
+                                    "severity": a.severity,
+                                    "rule_description": a.rule_description,
+                                    "message": a.message,
+                                    "start_line": a.start_line,
+                                    "end_line": a.end_line,
+                                }
+                                for a in file_alerts
+                            ],
+                        )
 
-            try:
-                await recorder.record(
-                    tool=tool,
-                    event_type="alert_triaged",
-                    detail=f"Fetching {file_path} for {len(file_alerts)} alert(s)",
-                    alert_number=file_alerts[0].number,
-                    metadata={
-                        "file_path": file_path,
-                        "alert_count": len(file_alerts),
-                        "alert_numbers": [a.number for a in file_alerts],
-                    },
-                )
-                file_content = await github.get_file_content(file_path, branch_name)
-
-                # Build prompt
-                if len(file_alerts) == 1:
-                    alert = file_alerts[0]
-                    prompt = build_prompt_for_alert(
-                        alert_rule_id=alert.rule_id,
-                        alert_severity=alert.severity,
-                        alert_rule_description=alert.rule_description,
-                        alert_message=alert.message,
-                        alert_file_path=alert.file_path,
-                        alert_start_line=alert.start_line,
-                        alert_end_line=alert.end_line,
-                        file_content=file_content,
-                    )
-                else:
-                    prompt = build_grouped_prompt_for_file(
-                        file_path=file_path,
-                        file_content=file_content,
-                        alerts=[
-                            {
-                                "rule_id": a.rule_id,
-                                "severity": a.severity,
-                                "rule_description": a.rule_description,
-                                "message": a.message,
-                                "start_line": a.start_line,
-                                "end_line": a.end_line,
-                            }
-                            for a in file_alerts
-                        ],
+                    prompt_tokens = await count_tokens_async(prompt)
+                    recorder.record(
+                        tool=tool,
+                        event_type="api_call_sent",
+                        detail=f"Sending {len(file_alerts)} alert(s) for {file_path} to {tool}",
+                        alert_number=file_alerts[0].number,
+                        metadata={
+                            "prompt_tokens": prompt_tokens,
+                            "file_path": file_path,
+                            "alert_count": len(file_alerts),
+                        },
                     )
 
-                prompt_tokens = count_tokens(prompt)
-                await recorder.record(
-                    tool=tool,
-                    event_type="api_call_sent",
-                    detail=f"Sending {len(file_alerts)} alert(s) for {file_path} to {tool}",
-                    alert_number=file_alerts[0].number,
-                    metadata={
-                        "prompt_tokens": prompt_tokens,
-                        "file_path": file_path,
-                        "alert_count": len(file_alerts),
-                    },
-                )
+                    llm_result = await call_llm_with_delay(tool, prompt)
 
-                llm_result = await call_llm_with_delay(tool, prompt)
+                    if not llm_result.extracted_code or not llm_result.extracted_code.strip():
+                        raise ValueError("LLM returned empty response")
 
-                if not llm_result.extracted_code or not llm_result.extracted_code.strip():
-                    raise ValueError("LLM returned empty response")
+                    call_cost = compute_llm_call_cost(
+                        tool, llm_result.input_tokens, llm_result.output_tokens,
+                    )
 
-                call_cost = compute_llm_call_cost(
-                    tool, llm_result.input_tokens, llm_result.output_tokens,
-                )
+                    recorder.record(
+                        tool=tool,
+                        event_type="patch_generated",
+                        detail=f"{llm_result.model} generated fix for {len(file_alerts)} alert(s) in {file_path}",
+                        alert_number=file_alerts[0].number,
+                        metadata={
+                            "model": llm_result.model,
+                            "latency_ms": llm_result.latency_ms,
+                            "input_tokens": llm_result.input_tokens,
+                            "output_tokens": llm_result.output_tokens,
+                            "file_path": file_path,
+                            "raw_response": llm_result.raw_response_text[:5000],
+                        },
+                        cost_usd=call_cost,
+                    )
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="patch_generated",
-                    detail=f"{llm_result.model} generated fix for {len(file_alerts)} alert(s) in {file_path}",
-                    alert_number=file_alerts[0].number,
-                    metadata={
-                        "model": llm_result.model,
-                        "latency_ms": llm_result.latency_ms,
-                        "input_tokens": llm_result.input_tokens,
-                        "output_tokens": llm_result.output_tokens,
-                        "file_path": file_path,
-                        "raw_response": llm_result.raw_response_text[:5000],
-                    },
-                    cost_usd=call_cost,
-                )
+                    # Commit fix
+                    alert_refs = ", ".join(f"#{a.number}" for a in file_alerts)
+                    commit_msg = (
+                        f"fix: remediate {len(file_alerts)} alert(s) "
+                        f"({alert_refs}) in {file_path} via {tool}"
+                    )
+                    async with commit_lock:
+                        commit_sha = await github.update_file_content(
+                            path=file_path,
+                            new_content=llm_result.extracted_code,
+                            branch=branch_name,
+                            commit_message=commit_msg,
+                        )
 
-                # Commit fix
-                alert_refs = ", ".join(f"#{a.number}" for a in file_alerts)
-                commit_msg = (
-                    f"fix: remediate {len(file_alerts)} alert(s) "
-                    f"({alert_refs}) in {file_path} via {tool}"
-                )
-                commit_sha = await github.update_file_content(
-                    path=file_path,
-                    new_content=llm_result.extracted_code,
-                    branch=branch_name,
-                    commit_message=commit_msg,
-                )
+                    recorder.record(
+                        tool=tool,
+                        event_type="patch_applied",
+                        detail=f"Patch committed to {branch_name} for {file_path}",
+                        alert_number=file_alerts[0].number,
+                        metadata={
+                            "commit_sha": commit_sha,
+                            "branch": branch_name,
+                            "file_path": file_path,
+                        },
+                    )
+                    return len(file_alerts), 0
 
-                await recorder.record(
-                    tool=tool,
-                    event_type="patch_applied",
-                    detail=f"Patch committed to {branch_name} for {file_path}",
-                    alert_number=file_alerts[0].number,
-                    metadata={
-                        "commit_sha": commit_sha,
-                        "branch": branch_name,
-                        "file_path": file_path,
-                    },
-                )
-                completed += len(file_alerts)
+                except Exception as e:
+                    error_msg = str(e)[:500]
+                    logger.exception("Benchmark %s: failed to remediate %s", tool, file_path)
+                    recorder.record(
+                        tool=tool,
+                        event_type="error",
+                        detail=f"Failed to remediate {file_path}: {error_msg[:200]}",
+                        alert_number=file_alerts[0].number,
+                        metadata={"error": error_msg, "file_path": file_path},
+                    )
+                    return 0, len(file_alerts)
 
-            except Exception as e:
-                logger.exception("Benchmark %s: failed to remediate %s", tool, file_path)
-                await recorder.record(
-                    tool=tool,
-                    event_type="error",
-                    detail=f"Failed to remediate {file_path}: {str(e)[:200]}",
-                    alert_number=file_alerts[0].number,
-                    metadata={"error": str(e)[:500], "file_path": file_path},
-                )
-                failed += len(file_alerts)
+        results = await asyncio.gather(
+            *(_process_file(fp, fa) for fp, fa in file_groups.items())
+        )
+        completed = sum(r[0] for r in results if r is not None)
+        failed = sum(r[1] for r in results if r is not None)
+        if None in results:
+            recorder.record(
+                tool=tool,
+                event_type="cancelled",
+                detail=f"{tool} cancelled after {completed} fixed, {failed} failed",
+                metadata={"completed": completed, "failed": failed},
+            )
 
-        await recorder.record(
+        recorder.record(
             tool=tool,
             event_type="remediation_complete",
             detail=(
@@ -1398,10 +1625,36 @@ async def _benchmark_api_tool(
                 "branch": branch_name,
             },
         )
+        # Make sure this tool's events are written before it reports done
+        await recorder.flush()
     except Exception:
         logger.exception("Benchmark %s task failed", tool)
-    finally:
-        await db.close()
+
+
+def _devin_session_raw(status_data: dict) -> dict:
+    """Digest of a Devin session response for the replay log.
+
+    The full payload (messages, structured output, ...) is only kept when
+    debug logging is on, since it is by far the largest event metadata.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        return status_data
+    return {
+        "status": status_data.get("status"),
+        "status_detail": status_data.get("status_detail"),
+        "acus_consumed": status_data.get("acus_consumed"),
+        "pr_urls": [pr.get("pr_url") for pr in status_data.get("pull_requests") or []],
+    }
+
+
+def _devin_poll_delay(attempt: int) -> float:
+    """Jittered exponential delay before the ``attempt``-th status poll.
+
+    Starts at ``DEVIN_POLL_INITIAL`` and grows by ``DEVIN_POLL_BACKOFF`` up to
+    ``DEVIN_POLL_INTERVAL``; the jitter keeps concurrent pollers from syncing.
+    """
+    delay = min(DEVIN_POLL_INTERVAL, DEVIN_POLL_INITIAL * DEVIN_POLL_BACKOFF ** attempt)
+    return delay * (0.8 + 0.2 * random.random())
 
 
 def _is_devin_session_done(status_data: dict) -> tuple[bool, str]:
@@ -1430,6 +1683,7 @@ async def _benchmark_devin(
     start_time: float | None = None,
     branch_name: str | None = None,
     cancel_event: asyncio.Event | None = None,
+    file_groups: Mapping[str, list[Alert]] | None = None,
 ) -> None:
     """Background task: run Devin remediation using a **single session**.
 
@@ -1446,34 +1700,35 @@ async def _benchmark_devin(
     """
     if not settings.devin_api_key or not settings.devin_org_id:
         recorder = await ReplayRecorder.attach(run_id, ["devin"], resolved_repo, start_time=start_time)
-        await recorder.record(
+        recorder.record(
             tool="devin",
             event_type="error",
             detail="DEVIN_API_KEY or DEVIN_ORG_ID not configured — skipping",
         )
         return
 
-    github = GitHubClient(repo=resolved_repo)
-    devin = DevinClient()
+    github = get_github_client(resolved_repo)
+    devin = get_devin_client()
 
     # Use pre-created branch if provided, otherwise create one (legacy path)
     if branch_name is None:
-        branch_name = f"remediate/devin-bench-{int(_time.time())}"
+        branch_name = f"remediate/devin-bench-{next(_branch_counter)}"
         try:
             await github.create_branch(branch_name, from_branch=baseline_branch)
         except Exception as e:
             recorder = await ReplayRecorder.attach(run_id, ["devin"], resolved_repo, start_time=start_time)
-            await recorder.record(
+            recorder.record(
                 tool="devin",
                 event_type="error",
                 detail=f"Failed to create branch {branch_name}: {e}",
             )
             return
 
-    file_groups = _group_alerts_by_file(alerts)
+    if file_groups is None:
+        file_groups = _group_alerts_by_file(alerts)
 
     recorder = await ReplayRecorder.attach(run_id, ["devin"], resolved_repo, start_time=start_time)
-    await recorder.record(
+    recorder.record(
         tool="devin",
         event_type="scan_started",
         detail=(
@@ -1495,18 +1750,80 @@ async def _benchmark_devin(
     session_id = ""
     session_url = ""
     # Track per-file-group info for the UI
-    all_sessions: list[dict] = []  # {session_id, file_path, status, url}
+    all_sessions: dict[str, dict] = {}  # file_path -> {session_id, file_path, status, url}
+    # Commit listing for the previous group, collected once the next
+    # group's message is sent: (task, file_path, file_alerts, session_id)
+    pending_commits: tuple[asyncio.Task[list[dict]], str, list[Alert], str] | None = None
+
+    async def _collect_commits(
+        task: asyncio.Task[list[dict]], group_path: str, group_alerts: list[Alert], group_session: str,
+    ) -> None:
+        """Record patch_applied events for the commits a file group produced."""
+        nonlocal total_commits, last_known_sha
+        try:
+            new_commits = await task
+
+            if new_commits:
+                # Record one patch_applied per alert in this group
+                # (so 3 alerts = 3 fixes, not 1)
+                recorder.record_many(
+                    {
+                        "tool": "devin",
+                        "event_type": "patch_applied",
+                        "detail": (
+                            f"Devin fix for alert #{alert.number} "
+                            f"({alert.rule_id}) in {group_path}"
+                        ),
+                        "alert_number": alert.number,
+                        "metadata": {
+                            "commit_sha": new_commits[0]["sha"],
+                            "branch": branch_name,
+                            "commit_count": len(new_commits),
+                            "session_id": group_session,
+                            "file_path": group_path,
+                        },
+                    }
+                    for alert in group_alerts
+                )
+                total_commits += len(new_commits)
+                last_known_sha = new_commits[0]["sha"]
+            else:
+                logger.info(
+                    "Benchmark %d: no new commits from session %s for %s",
+                    run_id, group_session, group_path,
+                )
+
+        except Exception as e:
+            error_msg = str(e)[:500]
+            logger.exception(
+                "Benchmark devin: failed to list commits after %s", group_path,
+            )
+            recorder.record(
+                tool="devin",
+                event_type="error",
+                detail=f"Failed to check commits for {group_path}: {error_msg[:200]}",
+                metadata={"error": error_msg, "session_id": group_session},
+            )
 
     try:
         # Capture branch HEAD before Devin pushes any commits
         last_known_sha = await github.get_branch_sha(branch_name)
 
         file_group_items = list(file_groups.items())
+        # alerts_from[i] = alerts in groups i.., for failing the remaining groups
+        alerts_from = [
+            *itertools.accumulate(len(fa) for _, fa in reversed(file_group_items)),
+        ][::-1] + [0]
 
         for idx, (file_path, file_alerts) in enumerate(file_group_items):
+            # Shared by this group's events
+            first_alert_number = file_alerts[0].number
+            alert_numbers = [a.number for a in file_alerts]
+            group_size = len(file_alerts)
+
             # Check for cancellation before each task
             if cancel_event and cancel_event.is_set():
-                await recorder.record(
+                recorder.record(
                     tool="devin",
                     event_type="cancelled",
                     detail=f"Devin cancelled after {idx}/{len(file_group_items)} file group(s)",
@@ -1521,31 +1838,31 @@ async def _benchmark_devin(
                     "Benchmark %d: no session_id — skipping remaining %d group(s)",
                     run_id, len(file_group_items) - idx,
                 )
-                failed += sum(len(fa) for _, fa in file_group_items[idx:])
+                failed += alerts_from[idx]
                 break
 
             try:
                 if idx == 0:
                     # Create the single session with the first file group
-                    await recorder.record(
+                    recorder.record(
                         tool="devin",
                         event_type="session_created",
                         detail=(
                             f"[{idx + 1}/{len(file_group_items)}] Creating Devin session "
-                            f"for {len(file_alerts)} alert(s) in {file_path}"
+                            f"for {group_size} alert(s) in {file_path}"
                         ),
-                        alert_number=file_alerts[0].number,
+                        alert_number=first_alert_number,
                         metadata={
                             "file_path": file_path,
-                            "alert_count": len(file_alerts),
-                            "alert_numbers": [a.number for a in file_alerts],
+                            "alert_count": group_size,
+                            "alert_numbers": alert_numbers,
                             "branch": branch_name,
                             "group_index": idx + 1,
                             "total_groups": len(file_group_items),
                         },
                     )
 
-                    if len(file_alerts) == 1:
+                    if group_size == 1:
                         result = await devin.create_remediation_session(
                             file_alerts[0], resolved_repo, branch_name,
                         )
@@ -1556,15 +1873,6 @@ async def _benchmark_devin(
                     session_id = result.get("session_id", "")
                     session_url = result.get("url", f"https://app.devin.ai/sessions/{session_id}")
 
-                    for alert in file_alerts:
-                        await db.execute(
-                            """INSERT INTO devin_sessions
-                               (repo, session_id, alert_number, rule_id, file_path, status)
-                               VALUES (?, ?, ?, ?, ?, 'running')""",
-                            (resolved_repo, session_id, alert.number, alert.rule_id, alert.file_path),
-                        )
-                    await db.commit()
-
                 else:
                     # Send the next file group as a follow-up message
                     followup = devin.build_followup_message(
@@ -1572,52 +1880,53 @@ async def _benchmark_devin(
                     )
                     await devin.send_message(session_id, followup)
 
-                    # Record DB rows for the new alert group (same session)
-                    for alert in file_alerts:
-                        await db.execute(
-                            """INSERT OR IGNORE INTO devin_sessions
-                               (repo, session_id, alert_number, rule_id, file_path, status)
-                               VALUES (?, ?, ?, ?, ?, 'running')""",
-                            (resolved_repo, session_id, alert.number, alert.rule_id, alert.file_path),
-                        )
-                    await db.commit()
+                # Record DB rows for this alert group (same session) in one batch
+                await db.executemany(
+                    _INSERT_BENCH_SESSION_SQL,
+                    [
+                        (resolved_repo, session_id, alert.number, alert.rule_id, alert.file_path)
+                        for alert in file_alerts
+                    ],
+                )
+                await db.commit()
 
-                    await recorder.record(
+                if idx > 0:
+                    recorder.record(
                         tool="devin",
                         event_type="message_sent",
                         detail=(
                             f"[{idx + 1}/{len(file_group_items)}] Sent follow-up message "
-                            f"for {len(file_alerts)} alert(s) in {file_path}"
+                            f"for {group_size} alert(s) in {file_path}"
                         ),
-                        alert_number=file_alerts[0].number,
+                        alert_number=first_alert_number,
                         metadata={
                             "session_id": session_id,
                             "session_url": session_url,
                             "file_path": file_path,
-                            "alert_count": len(file_alerts),
-                            "alert_numbers": [a.number for a in file_alerts],
+                            "alert_count": group_size,
+                            "alert_numbers": alert_numbers,
                             "group_index": idx + 1,
                             "total_groups": len(file_group_items),
                         },
                     )
 
                 # Track this file group in the UI list
-                all_sessions.append({
+                all_sessions[file_path] = {
                     "session_id": session_id,
                     "file_path": file_path,
                     "status": "running",
                     "url": session_url,
-                })
+                }
 
                 if idx == 0:
-                    await recorder.record(
+                    recorder.record(
                         tool="devin",
                         event_type="analyzing",
                         detail=(
                             f"[{idx + 1}/{len(file_group_items)}] Devin session started "
                             f"for {file_path}"
                         ),
-                        alert_number=file_alerts[0].number,
+                        alert_number=first_alert_number,
                         metadata={
                             "session_id": session_id,
                             "session_url": session_url,
@@ -1627,35 +1936,39 @@ async def _benchmark_devin(
                     )
 
             except Exception as e:
+                error_msg = str(e)[:500]
                 logger.exception("Benchmark devin: failed to create/message session for %s", file_path)
-                await recorder.record(
+                recorder.record(
                     tool="devin",
                     event_type="error",
-                    detail=f"Failed to create/message session for {file_path}: {str(e)[:200]}",
-                    alert_number=file_alerts[0].number,
-                    metadata={"error": str(e)[:500], "file_path": file_path},
+                    detail=f"Failed to create/message session for {file_path}: {error_msg[:200]}",
+                    alert_number=first_alert_number,
+                    metadata={"error": error_msg, "file_path": file_path},
                 )
-                failed += len(file_alerts)
+                failed += group_size
                 continue
+            finally:
+                # The previous group's commit listing ran alongside this
+                # group's Devin call; collect it before polling again
+                if pending_commits is not None:
+                    await _collect_commits(*pending_commits)
+                    pending_commits = None
 
             # -- Step 2: Poll until waiting_for_user or hard terminal --
             poll_start = _time.monotonic()
             task_done = False
             effective_status = "unknown"
+            poll_attempt = 0
+            last_state: tuple | None = None
+            # Terminal row values, written once after the loop
+            final_status: str | None = None
+            final_pr_url: str | None = None
+            final_acus: float | None = None
 
             while not task_done:
                 if cancel_event and cancel_event.is_set():
-                    for s in all_sessions:
-                        if s["file_path"] == file_path:
-                            s["status"] = "cancelled"
-                    await db.execute(
-                        """UPDATE devin_sessions
-                           SET status = 'cancelled', updated_at = datetime('now')
-                           WHERE repo = ? AND session_id = ? AND file_path = ?""",
-                        (resolved_repo, session_id, file_path),
-                    )
-                    await db.commit()
-                    await recorder.record(
+                    all_sessions[file_path]["status"] = final_status = "cancelled"
+                    recorder.record(
                         tool="devin",
                         event_type="cancelled",
                         detail=f"Cancelled while polling session {session_id} for {file_path}",
@@ -1669,104 +1982,80 @@ async def _benchmark_devin(
                         "Benchmark %d: Devin session %s timed out after %.0fs for %s",
                         run_id, session_id, elapsed, file_path,
                     )
-                    for s in all_sessions:
-                        if s["file_path"] == file_path:
-                            s["status"] = "timeout"
-                    await db.execute(
-                        """UPDATE devin_sessions
-                           SET status = 'timeout', updated_at = datetime('now')
-                           WHERE repo = ? AND session_id = ? AND file_path = ?""",
-                        (resolved_repo, session_id, file_path),
-                    )
-                    await db.commit()
-                    await recorder.record(
+                    effective_status = "timeout"
+                    all_sessions[file_path]["status"] = final_status = effective_status
+                    recorder.record(
                         tool="devin",
                         event_type="polling_timeout",
                         detail=(
                             f"Session {session_id} timed out after "
                             f"{int(elapsed)}s for {file_path}"
                         ),
-                        alert_number=file_alerts[0].number,
+                        alert_number=first_alert_number,
                         metadata={
                             "session_id": session_id,
                             "elapsed_s": int(elapsed),
                             "file_path": file_path,
                         },
                     )
-                    failed += len(file_alerts)
+                    failed += group_size
                     break
 
-                await asyncio.sleep(DEVIN_POLL_INTERVAL)
+                if await _sleep_or_cancel(cancel_event, _devin_poll_delay(poll_attempt)):
+                    continue  # Record the cancellation at the top of the loop
+                poll_attempt += 1
 
                 try:
                     # Use list_sessions which reliably returns status_detail
-                    all_org_sessions = await devin.list_sessions()
-                    status_data = next(
-                        (s for s in all_org_sessions if s.get("session_id") == session_id),
-                        None,
-                    )
+                    status_data = (await devin.get_sessions_by_id()).get(session_id)
                     if status_data is None:
                         status_data = await devin.get_session_status(session_id)
 
-                    status = status_data.get("status", "unknown")
-                    status_detail = status_data.get("status_detail", "")
-
-                    # Hard terminal states — session is completely done
-                    if status in DEVIN_TERMINAL_STATES:
-                        task_done = True
-                        effective_status = status
-                    # waiting_for_user — Devin finished this task, ready for next
-                    elif status_detail in DEVIN_TERMINAL_STATUS_DETAILS:
-                        task_done = True
-                        effective_status = f"{status}:{status_detail}"
-                    else:
+                    # Hard terminal state, or waiting_for_user — Devin
+                    # finished this task and is ready for the next
+                    done, polled_status = _is_devin_session_done(status_data)
+                    if not done:
+                        # Poll quickly again after any visible progress
+                        state = (status_data.get("status"), status_data.get("status_detail"))
+                        if state != last_state:
+                            last_state = state
+                            poll_attempt = 0
                         continue  # Still running, keep polling
+                    task_done, effective_status = True, polled_status
 
                     acus = status_data.get("acus_consumed")
                     cost = compute_devin_session_cost(acus) if acus else 0.0
                     session_url = status_data.get("url", session_url)
 
                     # Update tracker for this file group
-                    for s in all_sessions:
-                        if s["file_path"] == file_path:
-                            s["status"] = effective_status
-                            s["url"] = session_url
+                    all_sessions[file_path].update(status=effective_status, url=session_url)
 
-                    await recorder.record(
+                    recorder.record(
                         tool="devin",
                         event_type="session_complete",
                         detail=(
                             f"[{idx + 1}/{len(file_group_items)}] Session {session_id} "
                             f"finished ({effective_status}) for {file_path}"
                         ),
-                        alert_number=file_alerts[0].number,
+                        alert_number=first_alert_number,
                         metadata={
                             "session_id": session_id,
                             "session_url": session_url,
                             "status": effective_status,
                             "file_path": file_path,
                             "acus_consumed": acus,
-                            "raw_response": status_data,
+                            "raw_response": _devin_session_raw(status_data),
                         },
                         cost_usd=cost,
                     )
 
-                    # Update devin_sessions table
                     prs = status_data.get("pull_requests", [])
-                    pr_url = prs[0].get("pr_url") if prs else None
-                    await db.execute(
-                        """UPDATE devin_sessions
-                           SET status = ?, pr_url = ?,
-                               acus = COALESCE(?, acus),
-                               updated_at = datetime('now')
-                           WHERE repo = ? AND session_id = ? AND file_path = ?""",
-                        (effective_status, pr_url, acus, resolved_repo, session_id, file_path),
-                    )
-                    await db.commit()
+                    final_pr_url = prs[0].get("pr_url") if prs else None
+                    final_status, final_acus = effective_status, acus
 
                     # Count as failed if hard terminal error
                     if effective_status in ("error", "suspended"):
-                        failed += len(file_alerts)
+                        failed += group_size
 
                 except Exception as e:
                     logger.warning(
@@ -1774,69 +2063,44 @@ async def _benchmark_devin(
                         session_id, e,
                     )
 
+            # Single devin_sessions write for however the poll ended
+            if final_status is not None:
+                await db.execute(
+                    _FINISH_BENCH_SESSION_SQL,
+                    (final_status, final_pr_url, final_acus, resolved_repo, session_id, file_path),
+                )
+                await db.commit()
+
             # -- Step 3: Detect new commits from this task --
             # Run BEFORE the hard-terminal break so that commits from
             # the current file group (including on "exit") are recorded.
-            try:
-                new_commits = await github.list_commits(
-                    branch_name, since_sha=last_known_sha,
-                )
-
-                if new_commits:
-                    # Record one patch_applied per alert in this group
-                    # (so 3 alerts = 3 fixes, not 1)
-                    for alert in file_alerts:
-                        await recorder.record(
-                            tool="devin",
-                            event_type="patch_applied",
-                            detail=(
-                                f"Devin fix for alert #{alert.number} "
-                                f"({alert.rule_id}) in {file_path}"
-                            ),
-                            alert_number=alert.number,
-                            metadata={
-                                "commit_sha": new_commits[0]["sha"],
-                                "branch": branch_name,
-                                "commit_count": len(new_commits),
-                                "session_id": session_id,
-                                "file_path": file_path,
-                            },
-                        )
-                    total_commits += len(new_commits)
-                    last_known_sha = new_commits[0]["sha"]
-                else:
-                    logger.info(
-                        "Benchmark %d: no new commits from session %s for %s",
-                        run_id, session_id, file_path,
-                    )
-
-            except Exception as e:
-                logger.exception(
-                    "Benchmark devin: failed to list commits after %s", file_path,
-                )
-                await recorder.record(
-                    tool="devin",
-                    event_type="error",
-                    detail=f"Failed to check commits for {file_path}: {str(e)[:200]}",
-                    metadata={"error": str(e)[:500], "session_id": session_id},
-                )
+            # The listing overlaps with the next group's Devin call.
+            pending_commits = (
+                asyncio.create_task(github.list_commits(branch_name, since_sha=last_known_sha)),
+                file_path,
+                file_alerts,
+                session_id,
+            )
 
             # If cancelled or hard terminal, stop processing further groups
             if cancel_event and cancel_event.is_set():
                 break
-            if session_id and effective_status in ("error", "suspended", "exit", "unknown"):
+            if session_id and effective_status in (
+                "error", "suspended", "exit", "timeout", "unknown",
+            ):
                 # Session ended for real or timed out — can't send more messages
                 logger.warning(
                     "Benchmark %d: Devin session %s reached terminal/timeout (%s), "
                     "stopping at group %d/%d",
                     run_id, session_id, effective_status, idx + 1, len(file_group_items),
                 )
-                failed += sum(
-                    len(fa) for _, fa in file_group_items[idx + 1:]
-                )
+                failed += alerts_from[idx + 1]
                 break
 
-        await recorder.record(
+        if pending_commits is not None:
+            await _collect_commits(*pending_commits)
+
+        recorder.record(
             tool="devin",
             event_type="remediation_complete",
             detail=(
@@ -1852,13 +2116,13 @@ async def _benchmark_devin(
                 "total_alerts": len(alerts),
                 "file_count": len(file_groups),
                 "branch": branch_name,
-                "sessions": all_sessions,
+                "sessions": list(all_sessions.values()),
             },
         )
+        # Make sure this tool's events are written before it reports done
+        await recorder.flush()
     except Exception:
         logger.exception("Benchmark devin task failed")
-    finally:
-        await db.close()
 
 
 async def _benchmark_copilot(
@@ -1871,16 +2135,16 @@ async def _benchmark_copilot(
     cancel_event: asyncio.Event | None = None,
 ) -> None:
     """Background task: run Copilot Autofix and record to shared run."""
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
 
     # Use pre-created branch if provided, otherwise create one (legacy path)
     if branch_name is None:
-        branch_name = f"remediate/copilot-bench-{int(_time.time())}"
+        branch_name = f"remediate/copilot-bench-{next(_branch_counter)}"
         try:
             await github.create_branch(branch_name, from_branch=baseline_branch)
         except Exception as e:
             recorder = await ReplayRecorder.attach(run_id, ["copilot"], resolved_repo, start_time=start_time)
-            await recorder.record(
+            recorder.record(
                 tool="copilot",
                 event_type="error",
                 detail=f"Failed to create branch {branch_name}: {e}",
@@ -1888,7 +2152,7 @@ async def _benchmark_copilot(
             return
 
     recorder = await ReplayRecorder.attach(run_id, ["copilot"], resolved_repo, start_time=start_time)
-    await recorder.record(
+    recorder.record(
         tool="copilot",
         event_type="scan_started",
         detail=f"Starting Copilot Autofix for {len(alerts)} alerts on {branch_name}",
@@ -1899,28 +2163,23 @@ async def _benchmark_copilot(
         },
     )
 
-    db = await get_db()
-    completed = 0
-    failed = 0
+    # Alerts run concurrently; the limiter keeps trigger calls spaced
+    # COPILOT_INTER_ALERT_DELAY apart and commits to the branch stay serialized
+    semaphore = asyncio.Semaphore(COPILOT_BENCHMARK_CONCURRENCY)
+    limiter = AsyncRateLimiter(max_rate=1, time_period=COPILOT_INTER_ALERT_DELAY)
+    commit_lock = asyncio.Lock()
 
-    try:
-        for idx, alert in enumerate(alerts):
-            # Check for cancellation before each alert
+    async def _process_alert(alert: Alert) -> bool | None:
+        """Autofix one alert; True if committed, None if skipped by a cancel."""
+        async with semaphore:
+            # Checked on both sides of the limiter so queued alerts drop out fast
             if cancel_event and cancel_event.is_set():
-                await recorder.record(
-                    tool="copilot",
-                    event_type="cancelled",
-                    detail=f"Copilot cancelled after {completed} fixed, {failed} failed",
-                    metadata={"completed": completed, "failed": failed},
-                )
-                break
-
-            # Rate limiting between triggers
-            if idx > 0:
-                await asyncio.sleep(COPILOT_INTER_ALERT_DELAY)
-
+                return None
+            await limiter.acquire()
+            if cancel_event and cancel_event.is_set():
+                return None
             try:
-                await recorder.record(
+                recorder.record(
                     tool="copilot",
                     event_type="autofix_triggered",
                     detail=f"Triggering Copilot Autofix for alert #{alert.number} ({alert.rule_id})",
@@ -1935,55 +2194,71 @@ async def _benchmark_copilot(
 
                 autofix = await github.poll_autofix(alert.number)
                 autofix_status = autofix.get("status", "unknown")
+                autofix_raw = _autofix_raw(autofix)
 
-                if autofix_status in ("succeeded", "success"):
-                    commit_msg = (
-                        f"fix: Copilot Autofix for alert #{alert.number} "
-                        f"({alert.rule_id}) in {alert.file_path}"
-                    )
-                    commit_result = await github.commit_autofix(
-                        alert.number, branch_name, commit_msg,
-                    )
-                    commit_sha = commit_result.get("sha", "")
-
-                    await recorder.record(
-                        tool="copilot",
-                        event_type="patch_applied",
-                        detail=f"Copilot fix committed for alert #{alert.number}",
-                        alert_number=alert.number,
-                        metadata={
-                            "commit_sha": commit_sha,
-                            "branch": branch_name,
-                            "file_path": alert.file_path,
-                            "raw_response": autofix,
-                        },
-                    )
-                    completed += 1
-                else:
-                    await recorder.record(
+                if autofix_status not in ("succeeded", "success"):
+                    recorder.record(
                         tool="copilot",
                         event_type="autofix_result",
                         detail=f"Autofix for alert #{alert.number}: {autofix_status}",
                         alert_number=alert.number,
                         metadata={
                             "autofix_status": autofix_status,
-                            "raw_response": autofix,
+                            "raw_response": autofix_raw,
                         },
                     )
-                    failed += 1
+                    return False
+
+                commit_msg = (
+                    f"fix: Copilot Autofix for alert #{alert.number} "
+                    f"({alert.rule_id}) in {alert.file_path}"
+                )
+                async with commit_lock:
+                    commit_result = await retry_on_rate_limit(
+                        lambda: github.commit_autofix(alert.number, branch_name, commit_msg),
+                    )
+                commit_sha = commit_result.get("sha", "")
+
+                recorder.record(
+                    tool="copilot",
+                    event_type="patch_applied",
+                    detail=f"Copilot fix committed for alert #{alert.number}",
+                    alert_number=alert.number,
+                    metadata={
+                        "commit_sha": commit_sha,
+                        "branch": branch_name,
+                        "file_path": alert.file_path,
+                        "raw_response": autofix_raw,
+                    },
+                )
+                return True
 
             except Exception as e:
+                error_msg = str(e)[:500]
                 logger.exception("Benchmark copilot: failed for alert #%d", alert.number)
-                await recorder.record(
+                recorder.record(
                     tool="copilot",
                     event_type="error",
-                    detail=f"Failed autofix for alert #{alert.number}: {str(e)[:200]}",
+                    detail=f"Failed autofix for alert #{alert.number}: {error_msg[:200]}",
                     alert_number=alert.number,
-                    metadata={"error": str(e)[:500]},
+                    metadata={"error": error_msg},
                 )
-                failed += 1
+                return False
+
+    try:
+        results = await asyncio.gather(*(_process_alert(alert) for alert in alerts))
+        completed = results.count(True)
+        failed = results.count(False)
 
-        await recorder.record(
+        if None in results:
+            recorder.record(
+                tool="copilot",
+                event_type="cancelled",
+                detail=f"Copilot cancelled after {completed} fixed, {failed} failed",
+                metadata={"completed": completed, "failed": failed},
+            )
+
+        recorder.record(
             tool="copilot",
             event_type="remediation_complete",
             detail=f"Copilot complete: {completed} fixed, {failed} failed out of {len(alerts)} alerts",
@@ -1994,10 +2269,10 @@ async def _benchmark_copilot(
                 "branch": branch_name,
             },
         )
+        # Make sure this tool's events are written before it reports done
+        await recorder.flush()
     except Exception:
         logger.exception("Benchmark copilot task failed")
-    finally:
-        await db.close()
 
 
 async def _run_benchmark_tasks(
@@ -2022,7 +2297,7 @@ async def _run_benchmark_tasks(
 
     had_exception = False
     try:
-        github = GitHubClient(repo=resolved_repo)
+        github = get_github_client(resolved_repo)
 
         # ---- Phase 1: Wait for CodeQL readiness on each branch ----
         if branch_map:
@@ -2031,14 +2306,14 @@ async def _run_benchmark_tasks(
             )
 
             # Get baseline alert count as the target
-            baseline_alerts = await github.get_alerts(baseline_branch, state="open")
+            baseline_alerts = await github.get_open_alerts(baseline_branch)
             baseline_count = len(baseline_alerts)
             logger.info(
                 "Benchmark %d: baseline branch '%s' has %d open alerts",
                 run_id, baseline_branch, baseline_count,
             )
 
-            await recorder.record(
+            recorder.record(
                 tool="benchmark",
                 event_type="codeql_waiting",
                 detail=(
@@ -2053,11 +2328,16 @@ async def _run_benchmark_tasks(
 
             ready_branches: set[str] = set()
             start_wait = _time_mod.monotonic()
+            probe_semaphore = asyncio.Semaphore(CODEQL_POLL_CONCURRENCY)
+
+            async def _probe(branch: str) -> int:
+                async with probe_semaphore:
+                    return await github.count_open_alerts(branch)
 
             while len(ready_branches) < len(branch_map):
                 # Check for cancellation during polling
                 if cancel_event and cancel_event.is_set():
-                    await recorder.record(
+                    recorder.record(
                         tool="benchmark",
                         event_type="cancelled",
                         detail="Benchmark cancelled during CodeQL wait phase",
@@ -2076,7 +2356,7 @@ async def _run_benchmark_tasks(
                         "Not ready: %s",
                         run_id, elapsed, not_ready,
                     )
-                    await recorder.record(
+                    recorder.record(
                         tool="benchmark",
                         event_type="codeql_timeout",
                         detail=(
@@ -2091,35 +2371,39 @@ async def _run_benchmark_tasks(
                     )
                     break
 
-                # Poll each not-yet-ready branch
-                for tool_name, branch in branch_map.items():
-                    if tool_name in ready_branches:
-                        continue
-                    try:
-                        branch_alerts = await github.get_alerts(branch, state="open")
-                        if len(branch_alerts) >= baseline_count:
-                            ready_branches.add(tool_name)
-                            await recorder.record(
-                                tool=tool_name,
-                                event_type="codeql_ready",
-                                detail=(
-                                    f"Branch {branch} ready: "
-                                    f"{len(branch_alerts)} alerts (target: {baseline_count})"
-                                ),
-                                metadata={
-                                    "branch": branch,
-                                    "alert_count": len(branch_alerts),
-                                    "baseline_count": baseline_count,
-                                },
-                            )
-                    except Exception as e:
+                # Poll every not-yet-ready branch concurrently
+                pending = [
+                    (tool_name, branch) for tool_name, branch in branch_map.items()
+                    if tool_name not in ready_branches
+                ]
+                results = await asyncio.gather(
+                    *(_probe(branch) for _, branch in pending), return_exceptions=True,
+                )
+                for (tool_name, branch), alert_count in zip(pending, results):
+                    if isinstance(alert_count, BaseException):
                         logger.debug(
                             "Benchmark %d: polling %s failed (expected during analysis): %s",
-                            run_id, branch, e,
+                            run_id, branch, alert_count,
+                        )
+                        continue
+                    if alert_count >= baseline_count:
+                        ready_branches.add(tool_name)
+                        recorder.record(
+                            tool=tool_name,
+                            event_type="codeql_ready",
+                            detail=(
+                                f"Branch {branch} ready: "
+                                f"{alert_count} alerts (target: {baseline_count})"
+                            ),
+                            metadata={
+                                "branch": branch,
+                                "alert_count": alert_count,
+                                "baseline_count": baseline_count,
+                            },
                         )
 
                 if len(ready_branches) < len(branch_map):
-                    await asyncio.sleep(CODEQL_POLL_INTERVAL)
+                    await _sleep_or_cancel(cancel_event, CODEQL_POLL_INTERVAL)
 
             # If cancelled during wait, return early (finally block handles cleanup)
             if cancel_event and cancel_event.is_set():
@@ -2127,48 +2411,53 @@ async def _run_benchmark_tasks(
 
         # ---- Phase 2: Launch tool remediation tasks ----
         tasks: list[asyncio.Task[None]] = []
+        watchdog = (
+            asyncio.create_task(_cancel_stragglers(cancel_event, tasks))
+            if cancel_event else None
+        )
 
-        for i, tool in enumerate(tools):
-            # Stagger tool launches to be rate-limit friendly
-            if i > 0:
-                await asyncio.sleep(INTER_TOOL_DELAY)
-
-            tool_branch = branch_map.get(tool) if branch_map else None
-
-            if tool == "devin":
-                task = asyncio.create_task(
-                    _benchmark_devin(
-                        run_id, alerts, resolved_repo, baseline_branch,
-                        start_time=run_start_time,
-                        branch_name=tool_branch,
-                        cancel_event=cancel_event,
-                    )
-                )
-            elif tool == "copilot":
-                task = asyncio.create_task(
-                    _benchmark_copilot(
-                        run_id, alerts, resolved_repo, baseline_branch,
-                        start_time=run_start_time,
-                        branch_name=tool_branch,
-                        cancel_event=cancel_event,
-                    )
-                )
-            elif tool in _API_TOOL_CONFIG:
-                task = asyncio.create_task(
-                    _benchmark_api_tool(
-                        tool, run_id, alerts, resolved_repo, baseline_branch,
-                        start_time=run_start_time,
-                        branch_name=tool_branch,
-                        cancel_event=cancel_event,
-                    )
-                )
-            else:
-                continue
-            tasks.append(task)
+        # Group once for every tool; read-only since the tasks share it
+        shared_file_groups = MappingProxyType(_group_alerts_by_file(alerts))
 
-        # Wait for all tools to finish
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            # Every tool runs in one task group, which waits for all of them
+            async with asyncio.TaskGroup() as tg:
+                for i, tool in enumerate(tools):
+                    # Stagger tool launches to be rate-limit friendly
+                    if i > 0 and await _sleep_or_cancel(cancel_event, INTER_TOOL_DELAY):
+                        break  # Tools already launched observe the cancel themselves
+
+                    tool_branch = branch_map.get(tool) if branch_map else None
+
+                    if tool == "devin":
+                        coro = _benchmark_devin(
+                            run_id, alerts, resolved_repo, baseline_branch,
+                            start_time=run_start_time,
+                            branch_name=tool_branch,
+                            cancel_event=cancel_event,
+                            file_groups=shared_file_groups,
+                        )
+                    elif tool == "copilot":
+                        coro = _benchmark_copilot(
+                            run_id, alerts, resolved_repo, baseline_branch,
+                            start_time=run_start_time,
+                            branch_name=tool_branch,
+                            cancel_event=cancel_event,
+                        )
+                    elif tool in _API_TOOL_CONFIG:
+                        coro = _benchmark_api_tool(
+                            tool, run_id, alerts, resolved_repo, baseline_branch,
+                            start_time=run_start_time,
+                            branch_name=tool_branch,
+                            cancel_event=cancel_event,
+                            file_groups=shared_file_groups,
+                        )
+                    else:
+                        continue
+                    tasks.append(tg.create_task(coro))
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
 
     except Exception:
         logger.exception("Benchmark %d: _run_benchmark_tasks failed", run_id)
@@ -2184,21 +2473,14 @@ async def _run_benchmark_tasks(
         else:
             final_status = "completed"
         db = await get_db()
-        try:
-            now = datetime.now(timezone.utc).isoformat()
-            # Use 'failed' if we hit an unexpected exception (run was still 'running')
-            cursor = await db.execute(
-                "SELECT status FROM replay_runs WHERE id = ?", (run_id,),
-            )
-            row = await cursor.fetchone()
-            if row and row["status"] == "running":
-                await db.execute(
-                    "UPDATE replay_runs SET status = ?, ended_at = ? WHERE id = ?",
-                    (final_status, now, run_id),
-                )
-                await db.commit()
-        finally:
-            await db.close()
+        # Only a run still 'running' is finished here (cancel_benchmark may
+        # have closed it already)
+        await db.execute(
+            "UPDATE replay_runs SET status = ?, ended_at = " + _SQL_NOW_ISO
+            + " WHERE id = ? AND status = 'running'",
+            (final_status, run_id),
+        )
+        await db.commit()
 
 
 @router.post("/benchmark", response_model=BenchmarkResponse)
@@ -2218,57 +2500,64 @@ async def trigger_benchmark(
     resolved_repo = await resolve_repo(repo)
     baseline_branch = await resolve_baseline_branch(resolved_repo)
 
-    github = GitHubClient(repo=resolved_repo)
-    all_alerts = await github.get_alerts(baseline_branch, state="open")
+    github = get_github_client(resolved_repo)
+    all_alerts = await github.get_open_alerts(baseline_branch)
 
-    # Filter by selected severities
-    severity_set = set(s.lower() for s in request.severities)
-    alerts = [a for a in all_alerts if a.severity.lower() in severity_set]
+    # Filter by selected severities, counting per severity in the same pass
+    severity_set = {s.lower() for s in request.severities}
+    alerts: list[Alert] = []
+    severity_counter: Counter[str] = Counter()
+    for a in all_alerts:
+        sev = a.severity.lower()
+        if sev in severity_set:
+            alerts.append(a)
+            severity_counter[sev] += 1
 
     if not alerts:
         raise HTTPException(
             status_code=404,
             detail="No open alerts matching the selected severities.",
         )
-
-    # Count alerts per severity
-    severity_counts: dict[str, int] = {}
-    for a in alerts:
-        sev = a.severity.lower()
-        severity_counts[sev] = severity_counts.get(sev, 0) + 1
+    severity_counts = dict(severity_counter)
 
     # Determine which tools to run
     tools = list(ALL_TOOLS)
 
     # Generate a single timestamp for all branches
-    bench_ts = int(_time.time())
+    bench_ts = next(_branch_counter)
     branch_map = {tool: f"remediate/{tool}-bench-{bench_ts}" for tool in tools}
 
-    # Create all branches upfront (failures return immediately to the caller)
-    for tool_name, branch_name in branch_map.items():
-        try:
+    # Create all branches upfront, concurrently (each is an independent ref);
+    # failures return immediately to the caller
+    branch_semaphore = asyncio.Semaphore(BENCHMARK_BRANCH_CONCURRENCY)
+
+    async def _create_branch(branch_name: str) -> None:
+        async with branch_semaphore:
             await github.create_branch(branch_name, from_branch=baseline_branch)
-        except Exception as e:
+
+    results = await asyncio.gather(
+        *(_create_branch(branch_name) for branch_name in branch_map.values()),
+        return_exceptions=True,
+    )
+    for (tool_name, branch_name), result in zip(branch_map.items(), results):
+        if isinstance(result, Exception):
             raise HTTPException(
                 status_code=500,
-                detail=f"Failed to create branch {branch_name} for {tool_name}: {e}",
+                detail=f"Failed to create branch {branch_name} for {tool_name}: {result}",
             )
 
     # Create the shared replay run
     now = datetime.now(timezone.utc).isoformat()
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            "INSERT INTO replay_runs"
-            " (repo, scan_id, started_at, status, tools, total_cost_usd)"
-            " VALUES (?, ?, ?, ?, ?, ?)",
-            (resolved_repo, None, now, "running", json.dumps(tools), 0.0),
-        )
-        run_id = cursor.lastrowid
-        assert run_id is not None
-        await db.commit()
-    finally:
-        await db.close()
+    cursor = await db.execute(
+        "INSERT INTO replay_runs"
+        " (repo, scan_id, started_at, status, tools, total_cost_usd)"
+        " VALUES (?, ?, ?, ?, ?, ?)",
+        (resolved_repo, None, now, "running", json.dumps(tools), 0.0),
+    )
+    run_id = cursor.lastrowid
+    assert run_id is not None
+    await db.commit()
 
     # Create cancel event for this run
     cancel_event = asyncio.Event()
@@ -2315,14 +2604,11 @@ async def cancel_benchmark(
 
     # Update run status immediately
     db = await get_db()
-    try:
-        now = datetime.now(timezone.utc).isoformat()
-        await db.execute(
-            "UPDATE replay_runs SET status = 'cancelled', ended_at = ? WHERE id = ?",
-            (now, run_id),
-        )
-        await db.commit()
-    finally:
-        await db.close()
+    await db.execute(
+        "UPDATE replay_runs SET status = 'cancelled', ended_at = " + _SQL_NOW_ISO
+        + " WHERE id = ?",
+        (run_id,),
+    )
+    await db.commit()
 
     return {"status": "cancelled", "run_id": run_id}
@@ -1,5 +1,6 @@
 """Report generation endpoints — CISO and CTO/VP Eng reports."""
 
+import asyncio
 import json
 import logging
 
@@ -8,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query
 
 from app.models.schemas import BranchSummary, ReportRequest
 from app.services.database import get_db
-from app.services.github_client import GitHubClient
+from app.services.github_client import GitHubClient, get_github_client
 from app.services.repo_resolver import (
     get_latest_tool_branches,
     resolve_baseline_branch,
@@ -19,6 +20,9 @@ from app.services.report_generator import generate_ciso_report, generate_cto_rep
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
+# Branches whose alerts are fetched at once when building a report
+REPORT_FETCH_CONCURRENCY = 5
+
 
 async def _get_branch_map(repo: str) -> dict[str, str]:
     baseline_branch = await resolve_baseline_branch(repo)
@@ -33,20 +37,29 @@ async def _fetch_alerts_for_report(
 
     Returns (baseline_alerts_dicts, {tool_name: alerts_dicts}).
     """
-    baseline_branch = branch_map["baseline"]
-    baseline_alerts = await github.get_alerts_with_cwe(baseline_branch)
-    baseline_dicts = [a.model_dump() for a in baseline_alerts]
-
-    tool_alerts_map: dict[str, list[dict]] = {}
-    for tool_name, branch in branch_map.items():
-        if tool_name == "baseline":
-            continue
-        try:
+    semaphore = asyncio.Semaphore(REPORT_FETCH_CONCURRENCY)
+
+    async def _fetch(branch: str) -> list[dict]:
+        async with semaphore:
             alerts = await github.get_alerts_with_cwe(branch)
-            tool_alerts_map[tool_name] = [a.model_dump() for a in alerts]
+        return [a.model_dump() for a in alerts]
+
+    async def _fetch_tool(tool_name: str, branch: str) -> list[dict]:
+        try:
+            return await _fetch(branch)
         except httpx.HTTPStatusError as e:
             logger.warning("Failed to fetch alerts for %s (%s): %s", tool_name, branch, e)
-            tool_alerts_map[tool_name] = []
+            return []
+
+    # Branches are independent, so fetch them concurrently (bounded)
+    tool_items = [(t, b) for t, b in branch_map.items() if t != "baseline"]
+    baseline_dicts, *tool_results = await asyncio.gather(
+        _fetch(branch_map["baseline"]),
+        *(_fetch_tool(tool_name, branch) for tool_name, branch in tool_items),
+    )
+    tool_alerts_map = {
+        tool_name: alerts for (tool_name, _), alerts in zip(tool_items, tool_results)
+    }
 
     return baseline_dicts, tool_alerts_map
 
@@ -57,59 +70,56 @@ async def _get_summaries_from_scan(
 ) -> tuple[BranchSummary | None, dict[str, BranchSummary] | None, str, int | None]:
     """Load scan summaries from DB. Returns (baseline_summary, tool_summaries, scan_date, resolved_scan_id)."""
     db = await get_db()
-    try:
-        if scan_id:
-            cursor = await db.execute(
-                "SELECT * FROM scans WHERE repo = ? AND id = ?",
-                (repo, scan_id),
-            )
-        else:
-            cursor = await db.execute(
-                "SELECT * FROM scans WHERE repo = ? ORDER BY created_at DESC LIMIT 1",
-                (repo,),
-            )
-        scan = await cursor.fetchone()
-        if not scan:
-            return None, None, "", None
-
-        actual_scan_id = scan["id"]
-        scan_date = scan["created_at"]
-
-        cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (actual_scan_id,))
-        rows = await cursor.fetchall()
-
-        baseline_summary: BranchSummary | None = None
-        tool_summaries: dict[str, BranchSummary] = {}
-        for row in rows:
+    if scan_id:
+        cursor = await db.execute(
+            "SELECT * FROM scans WHERE repo = ? AND id = ?",
+            (repo, scan_id),
+        )
+    else:
+        cursor = await db.execute(
+            "SELECT * FROM scans WHERE repo = ? ORDER BY created_at DESC LIMIT 1",
+            (repo,),
+        )
+    scan = await cursor.fetchone()
+    if not scan:
+        return None, None, "", None
+
+    actual_scan_id = scan["id"]
+    scan_date = scan["created_at"]
+
+    cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (actual_scan_id,))
+    rows = await cursor.fetchall()
+
+    baseline_summary: BranchSummary | None = None
+    tool_summaries: dict[str, BranchSummary] = {}
+    for row in rows:
+        estimated_tokens = 0
+        try:
+            if "estimated_prompt_tokens" in row.keys():
+                estimated_tokens = row["estimated_prompt_tokens"]
+        except Exception:
             estimated_tokens = 0
-            try:
-                if "estimated_prompt_tokens" in row.keys():
-                    estimated_tokens = row["estimated_prompt_tokens"]
-            except Exception:
-                estimated_tokens = 0
-
-            summary = BranchSummary(
-                branch=row["branch"],
-                tool=row["tool"],
-                total=row["total"],
-                open=row["open"],
-                fixed=row["fixed"],
-                dismissed=row["dismissed"],
-                critical=row["critical"],
-                high=row["high"],
-                medium=row["medium"],
-                low=row["low"],
-                other=row["other"],
-                estimated_prompt_tokens=estimated_tokens,
-            )
-            if row["tool"] == "baseline":
-                baseline_summary = summary
-            else:
-                tool_summaries[row["tool"]] = summary
-
-        return baseline_summary, tool_summaries, scan_date, actual_scan_id
-    finally:
-        await db.close()
+
+        summary = BranchSummary(
+            branch=row["branch"],
+            tool=row["tool"],
+            total=row["total"],
+            open=row["open"],
+            fixed=row["fixed"],
+            dismissed=row["dismissed"],
+            critical=row["critical"],
+            high=row["high"],
+            medium=row["medium"],
+            low=row["low"],
+            other=row["other"],
+            estimated_prompt_tokens=estimated_tokens,
+        )
+        if row["tool"] == "baseline":
+            baseline_summary = summary
+        else:
+            tool_summaries[row["tool"]] = summary
+
+    return baseline_summary, tool_summaries, scan_date, actual_scan_id
 
 
 @router.post("/generate/{report_type}")
@@ -135,7 +145,7 @@ async def generate_report(
         raise HTTPException(status_code=404, detail="No scan data found. Trigger a scan first.")
 
     # Fetch live CWE-enriched alerts
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
     branch_map = await _get_branch_map(resolved_repo)
 
     try:
@@ -178,15 +188,12 @@ async def generate_report(
 
     # Store report in DB
     db = await get_db()
-    try:
-        scan_id_val = resolved_scan_id or request.scan_id or 0
-        await db.execute(
-            "INSERT INTO generated_reports (scan_id, report_type, report_data) VALUES (?, ?, ?)",
-            (scan_id_val, report_type, json.dumps(report)),
-        )
-        await db.commit()
-    finally:
-        await db.close()
+    scan_id_val = resolved_scan_id or request.scan_id or 0
+    await db.execute(
+        "INSERT INTO generated_reports (scan_id, report_type, report_data) VALUES (?, ?, ?)",
+        (scan_id_val, report_type, json.dumps(report)),
+    )
+    await db.commit()
 
     return report
 
@@ -201,23 +208,20 @@ async def get_latest_report(
         raise HTTPException(status_code=400, detail="report_type must be 'ciso' or 'cto'")
 
     db = await get_db()
-    try:
-        resolved_repo = await resolve_repo(repo)
-        cursor = await db.execute(
-            """SELECT gr.report_data
-               FROM generated_reports gr
-               JOIN scans s ON gr.scan_id = s.id
-               WHERE gr.report_type = ? AND s.repo = ?
-               ORDER BY gr.created_at DESC
-               LIMIT 1""",
-            (report_type, resolved_repo),
-        )
-        row = await cursor.fetchone()
-        if not row:
-            raise HTTPException(status_code=404, detail=f"No {report_type} report found. Generate one first.")
-        return json.loads(row["report_data"])
-    finally:
-        await db.close()
+    resolved_repo = await resolve_repo(repo)
+    cursor = await db.execute(
+        """SELECT gr.report_data
+           FROM generated_reports gr
+           JOIN scans s ON gr.scan_id = s.id
+           WHERE gr.report_type = ? AND s.repo = ?
+           ORDER BY gr.created_at DESC
+           LIMIT 1""",
+        (report_type, resolved_repo),
+    )
+    row = await cursor.fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"No {report_type} report found. Generate one first.")
+    return json.loads(row["report_data"])
 
 
 @router.get("/history")
@@ -227,38 +231,35 @@ async def list_reports(
 ) -> list[dict]:
     """List all generated reports."""
     db = await get_db()
-    try:
-        resolved_repo = await resolve_repo(repo)
-        if report_type:
-            cursor = await db.execute(
-                """SELECT gr.id, gr.scan_id, gr.report_type, gr.created_at
-                   FROM generated_reports gr
-                   JOIN scans s ON gr.scan_id = s.id
-                   WHERE gr.report_type = ? AND s.repo = ?
-                   ORDER BY gr.created_at DESC""",
-                (report_type, resolved_repo),
-            )
-        else:
-            cursor = await db.execute(
-                """SELECT gr.id, gr.scan_id, gr.report_type, gr.created_at
-                   FROM generated_reports gr
-                   JOIN scans s ON gr.scan_id = s.id
-                   WHERE s.repo = ?
-                   ORDER BY gr.created_at DESC""",
-                (resolved_repo,),
-            )
-        rows = await cursor.fetchall()
-        return [
-            {
-                "id": row["id"],
-                "scan_id": row["scan_id"],
-                "report_type": row["report_type"],
-                "created_at": row["created_at"],
-            }
-            for row in rows
-        ]
-    finally:
-        await db.close()
+    resolved_repo = await resolve_repo(repo)
+    if report_type:
+        cursor = await db.execute(
+            """SELECT gr.id, gr.scan_id, gr.report_type, gr.created_at
+               FROM generated_reports gr
+               JOIN scans s ON gr.scan_id = s.id
+               WHERE gr.report_type = ? AND s.repo = ?
+               ORDER BY gr.created_at DESC""",
+            (report_type, resolved_repo),
+        )
+    else:
+        cursor = await db.execute(
+            """SELECT gr.id, gr.scan_id, gr.report_type, gr.created_at
+               FROM generated_reports gr
+               JOIN scans s ON gr.scan_id = s.id
+               WHERE s.repo = ?
+               ORDER BY gr.created_at DESC""",
+            (resolved_repo,),
+        )
+    rows = await cursor.fetchall()
+    return [
+        {
+            "id": row["id"],
+            "scan_id": row["scan_id"],
+            "report_type": row["report_type"],
+            "created_at": row["created_at"],
+        }
+        for row in rows
+    ]
 
 
 async def _get_remediation_times(
@@ -267,18 +268,15 @@ async def _get_remediation_times(
 ) -> dict[str, float] | None:
     """Get remediation timing from replay events if available."""
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            """SELECT re.tool, MAX(re.timestamp_offset_ms) as max_offset
-               FROM replay_events re
-               JOIN replay_runs rr ON re.run_id = rr.id
-               WHERE rr.repo = ? AND (? IS NULL OR rr.scan_id = ?)
-               GROUP BY re.tool""",
-            (repo, scan_id, scan_id),
-        )
-        rows = await cursor.fetchall()
-        if not rows:
-            return None
-        return {row["tool"]: row["max_offset"] / 1000.0 for row in rows}
-    finally:
-        await db.close()
+    cursor = await db.execute(
+        """SELECT re.tool, MAX(re.timestamp_offset_ms) as max_offset
+           FROM replay_events re
+           JOIN replay_runs rr ON re.run_id = rr.id
+           WHERE rr.repo = ? AND (? IS NULL OR rr.scan_id = ?)
+           GROUP BY re.tool""",
+        (repo, scan_id, scan_id),
+    )
+    rows = await cursor.fetchall()
+    if not rows:
+        return None
+    return {row["tool"]: row["max_offset"] / 1000.0 for row in rows}
@@ -1,5 +1,4 @@
 import asyncio
-import base64
 import logging
 from datetime import datetime, timezone
 
@@ -15,8 +14,8 @@ from app.models.schemas import (
     ScanSnapshot,
     TriggerScanResponse,
 )
-from app.services.database import get_db
-from app.services.github_client import GitHubClient
+from app.services.database import get_db, transaction
+from app.services.github_client import GitHubClient, get_github_client
 from app.services.replay_recorder import COPILOT_COST_PER_REQUEST, DEVIN_COST_PER_ACU
 from app.services.repo_resolver import (
     get_latest_tool_branches,
@@ -38,7 +37,7 @@ def _row_to_branch_summary(row) -> BranchSummary:
     estimated_tokens = 0
     unique_files = 0
     try:
-        # aiosqlite.Row supports `.keys()`
+        # Rows are dicts (see database._dict_row)
         keys = row.keys()
         if "estimated_prompt_tokens" in keys:
             estimated_tokens = row["estimated_prompt_tokens"]
@@ -94,31 +93,22 @@ async def _compute_baseline_token_estimate(
 
     sem = asyncio.Semaphore(5)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-
-        async def _fetch(path: str) -> None:
-            nonlocal rate_limited
-            async with sem:
-                try:
-                    response = await client.get(
-                        f"{github.BASE_URL}/repos/{github.repo}/contents/{path}",
-                        headers=github.headers,
-                        params={"ref": branch},
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    file_cache[path] = base64.b64decode(data["content"]).decode("utf-8")
-                except httpx.HTTPStatusError as e:
-                    remaining = (e.response.headers or {}).get("X-RateLimit-Remaining")
-                    if e.response.status_code == 403 and remaining == "0":
-                        rate_limited = True
-                    logger.warning("Failed to fetch file content for %s@%s: %s", path, branch, e)
-                    file_cache[path] = ""
-                except Exception as e:
-                    logger.warning("Failed to fetch file content for %s@%s: %s", path, branch, e)
-                    file_cache[path] = ""
-
-        await asyncio.gather(*[_fetch(p) for p in unique_paths])
+    async def _fetch(path: str) -> None:
+        nonlocal rate_limited
+        async with sem:
+            try:
+                file_cache[path] = await github.get_file_content(path, branch)
+            except httpx.HTTPStatusError as e:
+                remaining = (e.response.headers or {}).get("X-RateLimit-Remaining")
+                if e.response.status_code == 403 and remaining == "0":
+                    rate_limited = True
+                logger.warning("Failed to fetch file content for %s@%s: %s", path, branch, e)
+                file_cache[path] = ""
+            except Exception as e:
+                logger.warning("Failed to fetch file content for %s@%s: %s", path, branch, e)
+                file_cache[path] = ""
+
+    await asyncio.gather(*[_fetch(p) for p in unique_paths])
 
     if rate_limited:
         logger.warning("GitHub rate limited while fetching file contents; falling back to heuristic token estimate")
@@ -130,41 +120,46 @@ async def _compute_baseline_token_estimate(
     for alert in open_alerts:
         file_groups[alert.file_path].append(alert)
 
-    total_tokens = 0
-    for fpath, group_alerts in file_groups.items():
-        file_content = file_cache.get(fpath, "")
-        if len(group_alerts) == 1:
-            # Single alert: use per-alert prompt
-            a = group_alerts[0]
-            total_tokens += estimate_prompt_tokens_for_alert(
-                alert_rule_id=a.rule_id,
-                alert_severity=a.severity,
-                alert_rule_description=a.rule_description,
-                alert_message=a.message,
-                alert_file_path=a.file_path,
-                alert_start_line=a.start_line,
-                alert_end_line=a.end_line,
-                file_content=file_content,
-            )
-        else:
-            # Multiple alerts in same file: use grouped prompt (N contexts + 1 file)
-            prompt = build_grouped_prompt_for_file(
-                file_path=fpath,
-                file_content=file_content,
-                alerts=[
-                    {
-                        "rule_id": a.rule_id,
-                        "severity": a.severity,
-                        "rule_description": a.rule_description,
-                        "message": a.message,
-                        "start_line": a.start_line,
-                        "end_line": a.end_line,
-                    }
-                    for a in group_alerts
-                ],
-            )
-            total_tokens += count_tokens(prompt)
+    def _count_all() -> int:
+        """Build every file-group prompt and count its tokens."""
+        total_tokens = 0
+        for fpath, group_alerts in file_groups.items():
+            file_content = file_cache.get(fpath, "")
+            if len(group_alerts) == 1:
+                # Single alert: use per-alert prompt
+                a = group_alerts[0]
+                total_tokens += estimate_prompt_tokens_for_alert(
+                    alert_rule_id=a.rule_id,
+                    alert_severity=a.severity,
+                    alert_rule_description=a.rule_description,
+                    alert_message=a.message,
+                    alert_file_path=a.file_path,
+                    alert_start_line=a.start_line,
+                    alert_end_line=a.end_line,
+                    file_content=file_content,
+                )
+            else:
+                # Multiple alerts in same file: use grouped prompt (N contexts + 1 file)
+                prompt = build_grouped_prompt_for_file(
+                    file_path=fpath,
+                    file_content=file_content,
+                    alerts=[
+                        {
+                            "rule_id": a.rule_id,
+                            "severity": a.severity,
+                            "rule_description": a.rule_description,
+                            "message": a.message,
+                            "start_line": a.start_line,
+                            "end_line": a.end_line,
+                        }
+                        for a in group_alerts
+                    ],
+                )
+                total_tokens += count_tokens(prompt)
+        return total_tokens
 
+    # Tokenizing whole source files is CPU-bound; keep it off the event loop
+    total_tokens = await asyncio.to_thread(_count_all)
     return total_tokens, len(file_groups)
 
 
@@ -174,14 +169,45 @@ async def trigger_scan(
 ) -> TriggerScanResponse:
     """Trigger a new scan: fetch CodeQL alerts for the baseline branch and store a snapshot."""
     resolved_repo = await resolve_repo(repo)
-    github = GitHubClient(repo=resolved_repo)
+    github = get_github_client(resolved_repo)
     baseline_branch = await resolve_baseline_branch(resolved_repo)
     tool_branches = await get_latest_tool_branches(resolved_repo)
     branch_map: dict[str, str] = {"baseline": baseline_branch, **tool_branches}
     now = datetime.now(timezone.utc).isoformat()
 
-    db = await get_db()
-    try:
+    # Fetch everything from GitHub first; the scan is written afterwards in a
+    # single transaction, so readers never see a half-written snapshot
+    scanned: list[tuple[str, str, list[Alert], BranchSummary]] = []
+    baseline_alerts: list[Alert] = []
+
+    for tool_name, branch in branch_map.items():
+        try:
+            alerts = await github.get_alerts(branch)
+            summary = github.compute_branch_summary(alerts, branch, tool_name)
+
+            if tool_name == "baseline":
+                baseline_alerts = alerts
+
+            scanned.append((tool_name, branch, alerts, summary))
+            logger.info("Scanned %s %s (%s): %d alerts", resolved_repo, tool_name, branch, summary.total)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 403:
+                logger.error(
+                    "GitHub API 403 for %s (%s): token likely lacks "
+                    "'security_events' scope or 'Code scanning alerts: Read' permission",
+                    resolved_repo, branch,
+                )
+            else:
+                logger.exception("Failed to scan %s (%s)", resolved_repo, branch)
+        except Exception:
+            logger.exception("Failed to scan %s (%s)", resolved_repo, branch)
+
+    # Compute dynamic token estimates for baseline open alerts
+    estimated_tokens, unique_file_count = await _compute_baseline_token_estimate(
+        github, baseline_alerts, baseline_branch
+    )
+
+    async with transaction() as db:
         cursor = await db.execute(
             "INSERT INTO scans (repo, created_at) VALUES (?, ?)",
             (resolved_repo, now),
@@ -189,101 +215,71 @@ async def trigger_scan(
         scan_id = cursor.lastrowid
         assert scan_id is not None
 
-        branches_scanned: list[str] = []
-        baseline_alerts: list[Alert] = []
-
-        for tool_name, branch in branch_map.items():
-            try:
-                alerts = await github.get_alerts(branch)
-                summary = github.compute_branch_summary(alerts, branch, tool_name)
-
-                if tool_name == "baseline":
-                    baseline_alerts = alerts
-
-                await db.execute(
-                    """INSERT INTO scan_branches
-                       (scan_id, branch, tool, total, open, fixed, dismissed,
-                        critical, high, medium, low, other)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        scan_id,
-                        branch,
-                        tool_name,
-                        summary.total,
-                        summary.open,
-                        summary.fixed,
-                        summary.dismissed,
-                        summary.critical,
-                        summary.high,
-                        summary.medium,
-                        summary.low,
-                        summary.other,
-                    ),
+        await db.executemany(
+            """INSERT INTO scan_branches
+               (scan_id, branch, tool, total, open, fixed, dismissed,
+                critical, high, medium, low, other,
+                estimated_prompt_tokens, unique_file_count)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    scan_id,
+                    branch,
+                    tool_name,
+                    summary.total,
+                    summary.open,
+                    summary.fixed,
+                    summary.dismissed,
+                    summary.critical,
+                    summary.high,
+                    summary.medium,
+                    summary.low,
+                    summary.other,
+                    estimated_tokens if tool_name == "baseline" else 0,
+                    unique_file_count if tool_name == "baseline" else 0,
                 )
+                for tool_name, branch, _, summary in scanned
+            ],
+        )
 
-                for alert in alerts:
-                    await db.execute(
-                        """INSERT INTO alerts
-                           (scan_id, branch, alert_number, rule_id, rule_description,
-                            severity, state, tool, file_path, start_line, end_line,
-                            message, html_url, created_at, dismissed_at, fixed_at)
-                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                        (
-                            scan_id,
-                            branch,
-                            alert.number,
-                            alert.rule_id,
-                            alert.rule_description,
-                            alert.severity,
-                            alert.state,
-                            alert.tool,
-                            alert.file_path,
-                            alert.start_line,
-                            alert.end_line,
-                            alert.message,
-                            alert.html_url,
-                            alert.created_at,
-                            alert.dismissed_at,
-                            alert.fixed_at,
-                        ),
-                    )
-
-                branches_scanned.append(branch)
-                logger.info("Scanned %s %s (%s): %d alerts", resolved_repo, tool_name, branch, summary.total)
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 403:
-                    logger.error(
-                        "GitHub API 403 for %s (%s): token likely lacks "
-                        "'security_events' scope or 'Code scanning alerts: Read' permission",
-                        resolved_repo, branch,
-                    )
-                else:
-                    logger.exception("Failed to scan %s (%s)", resolved_repo, branch)
-            except Exception:
-                logger.exception("Failed to scan %s (%s)", resolved_repo, branch)
-
-        # Compute dynamic token estimates for baseline open alerts
-        estimated_tokens, unique_file_count = await _compute_baseline_token_estimate(
-            github, baseline_alerts, baseline_branch
+        await db.executemany(
+            """INSERT INTO alerts
+               (scan_id, branch, alert_number, rule_id, rule_description,
+                severity, state, tool, file_path, start_line, end_line,
+                message, html_url, created_at, dismissed_at, fixed_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    scan_id,
+                    branch,
+                    alert.number,
+                    alert.rule_id,
+                    alert.rule_description,
+                    alert.severity,
+                    alert.state,
+                    alert.tool,
+                    alert.file_path,
+                    alert.start_line,
+                    alert.end_line,
+                    alert.message,
+                    alert.html_url,
+                    alert.created_at,
+                    alert.dismissed_at,
+                    alert.fixed_at,
+                )
+                for _, branch, alerts, _ in scanned
+                for alert in alerts
+            ],
         )
-        if estimated_tokens > 0 or unique_file_count > 0:
-            await db.execute(
-                "UPDATE scan_branches"
-                " SET estimated_prompt_tokens = ?, unique_file_count = ?"
-                " WHERE scan_id = ? AND tool = 'baseline'",
-                (estimated_tokens, unique_file_count, scan_id),
-            )
 
-        await db.commit()
+    branches_scanned = [branch for _, branch, _, _ in scanned]
 
-        return TriggerScanResponse(
-            scan_id=scan_id,
-            repo=resolved_repo,
-            branches_scanned=branches_scanned,
-            created_at=now,
-        )
-    finally:
-        await db.close()
+    return TriggerScanResponse(
+        scan_id=scan_id,
+        repo=resolved_repo,
+        branches_scanned=branches_scanned,
+        created_at=now,
+    )
 
 
 @router.get("", response_model=list[ScanListItem])
@@ -292,34 +288,31 @@ async def list_scans(
 ) -> list[ScanListItem]:
     """List all scan snapshots, optionally filtered by repo."""
     db = await get_db()
-    try:
-        if repo:
-            cursor = await db.execute(
-                """SELECT s.id, s.repo, s.created_at,
-                          COUNT(sb.id) as branch_count
-                   FROM scans s
-                   LEFT JOIN scan_branches sb ON sb.scan_id = s.id
-                   WHERE s.repo = ?
-                   GROUP BY s.id
-                   ORDER BY s.created_at DESC""",
-                (repo,),
-            )
-        else:
-            cursor = await db.execute(
-                """SELECT s.id, s.repo, s.created_at,
-                          COUNT(sb.id) as branch_count
-                   FROM scans s
-                   LEFT JOIN scan_branches sb ON sb.scan_id = s.id
-                   GROUP BY s.id
-                   ORDER BY s.created_at DESC"""
-            )
-        rows = await cursor.fetchall()
-        return [
-            ScanListItem(id=row["id"], repo=row["repo"], created_at=row["created_at"], branch_count=row["branch_count"])
-            for row in rows
-        ]
-    finally:
-        await db.close()
+    if repo:
+        cursor = await db.execute(
+            """SELECT s.id, s.repo, s.created_at,
+                      COUNT(sb.id) as branch_count
+               FROM scans s
+               LEFT JOIN scan_branches sb ON sb.scan_id = s.id
+               WHERE s.repo = ?
+               GROUP BY s.id
+               ORDER BY s.created_at DESC""",
+            (repo,),
+        )
+    else:
+        cursor = await db.execute(
+            """SELECT s.id, s.repo, s.created_at,
+                      COUNT(sb.id) as branch_count
+               FROM scans s
+               LEFT JOIN scan_branches sb ON sb.scan_id = s.id
+               GROUP BY s.id
+               ORDER BY s.created_at DESC"""
+        )
+    rows = await cursor.fetchall()
+    return [
+        ScanListItem(id=row["id"], repo=row["repo"], created_at=row["created_at"], branch_count=row["branch_count"])
+        for row in rows
+    ]
 
 
 @router.get("/latest", response_model=ScanSnapshot | None)
@@ -328,51 +321,45 @@ async def get_latest_scan(
 ) -> ScanSnapshot | None:
     """Get the most recent scan snapshot with branch summaries."""
     db = await get_db()
-    try:
-        if repo:
-            cursor = await db.execute(
-                "SELECT id, repo, created_at FROM scans WHERE repo = ? ORDER BY created_at DESC LIMIT 1",
-                (repo,),
-            )
-        else:
-            cursor = await db.execute("SELECT id, repo, created_at FROM scans ORDER BY created_at DESC LIMIT 1")
-        scan = await cursor.fetchone()
-        if not scan:
-            return None
+    if repo:
+        cursor = await db.execute(
+            "SELECT id, repo, created_at FROM scans WHERE repo = ? ORDER BY created_at DESC LIMIT 1",
+            (repo,),
+        )
+    else:
+        cursor = await db.execute("SELECT id, repo, created_at FROM scans ORDER BY created_at DESC LIMIT 1")
+    scan = await cursor.fetchone()
+    if not scan:
+        return None
 
-        scan_id = scan["id"]
-        cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (scan_id,))
-        branch_rows = await cursor.fetchall()
+    scan_id = scan["id"]
+    cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (scan_id,))
+    branch_rows = await cursor.fetchall()
 
-        branches = {}
-        for row in branch_rows:
-            branches[row["tool"]] = _row_to_branch_summary(row)
+    branches = {}
+    for row in branch_rows:
+        branches[row["tool"]] = _row_to_branch_summary(row)
 
-        return ScanSnapshot(id=scan_id, repo=scan["repo"], created_at=scan["created_at"], branches=branches)
-    finally:
-        await db.close()
+    return ScanSnapshot(id=scan_id, repo=scan["repo"], created_at=scan["created_at"], branches=branches)
 
 
 @router.get("/{scan_id}", response_model=ScanSnapshot)
 async def get_scan(scan_id: int) -> ScanSnapshot:
     """Get a specific scan snapshot."""
     db = await get_db()
-    try:
-        cursor = await db.execute("SELECT id, repo, created_at FROM scans WHERE id = ?", (scan_id,))
-        scan = await cursor.fetchone()
-        if not scan:
-            raise HTTPException(status_code=404, detail="Scan not found")
+    cursor = await db.execute("SELECT id, repo, created_at FROM scans WHERE id = ?", (scan_id,))
+    scan = await cursor.fetchone()
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
 
-        cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (scan_id,))
-        branch_rows = await cursor.fetchall()
+    cursor = await db.execute("SELECT * FROM scan_branches WHERE scan_id = ?", (scan_id,))
+    branch_rows = await cursor.fetchall()
 
-        branches = {}
-        for row in branch_rows:
-            branches[row["tool"]] = _row_to_branch_summary(row)
+    branches = {}
+    for row in branch_rows:
+        branches[row["tool"]] = _row_to_branch_summary(row)
 
-        return ScanSnapshot(id=scan["id"], repo=scan["repo"], created_at=scan["created_at"], branches=branches)
-    finally:
-        await db.close()
+    return ScanSnapshot(id=scan["id"], repo=scan["repo"], created_at=scan["created_at"], branches=branches)
 
 
 @router.get("/compare/latest", response_model=ComparisonResult)
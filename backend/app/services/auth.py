@@ -4,6 +4,7 @@ Follows the pattern from ktph-backend: direct DB lookup with a TTL cache
 instead of making HTTP calls to the frontend.
 """
 
+import asyncio
 import logging
 import sqlite3
 import time
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 # Simple TTL cache: {token: (user_dict, expiry_timestamp)}
 _cache: dict[str, tuple[dict, float]] = {}
 _CACHE_TTL = 60  # seconds
+_CACHE_MAX_ENTRIES = 4096
 
 
 def _get_auth_db() -> sqlite3.Connection:
@@ -26,6 +28,36 @@ def _get_auth_db() -> sqlite3.Connection:
     return conn
 
 
+def _cache_put(db_token: str, user: dict) -> None:
+    """Store a validated user, evicting expired (then oldest) entries when full."""
+    if len(_cache) >= _CACHE_MAX_ENTRIES:
+        now = time.monotonic()
+        for key in [k for k, (_, expires) in _cache.items() if expires <= now]:
+            del _cache[key]
+        while len(_cache) >= _CACHE_MAX_ENTRIES:
+            del _cache[next(iter(_cache))]
+    _cache[db_token] = (user, time.monotonic() + _CACHE_TTL)
+
+
+def _lookup_session(db_token: str) -> dict | None:
+    """Blocking lookup of the user owning an unexpired session token."""
+    conn = _get_auth_db()
+    try:
+        cursor = conn.execute(
+            """
+            SELECT u.id AS user_id, u.name, u.email
+            FROM session s
+            JOIN user u ON s.userId = u.id
+            WHERE s.token = ? AND s.expiresAt > strftime('%Y-%m-%dT%H:%M:%S', 'now')
+            """,
+            (db_token,),
+        )
+        row = cursor.fetchone()
+    finally:
+        conn.close()
+    return dict(row) if row else None
+
+
 async def get_session_token(request: Request) -> str:
     """Extract the Better Auth session token from the request."""
     # Check cookie first (same-origin requests)
@@ -65,26 +97,11 @@ async def validate_session(
             return user
         del _cache[db_token]
 
-    # Query the auth database directly
+    # Query the auth database directly (off the event loop — sqlite3 blocks)
     try:
-        conn = _get_auth_db()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT u.id AS user_id, u.name, u.email
-                FROM session s
-                JOIN user u ON s.userId = u.id
-                WHERE s.token = ? AND s.expiresAt > strftime('%Y-%m-%dT%H:%M:%S', 'now')
-                """,
-                (db_token,),
-            )
-            row = cursor.fetchone()
-        finally:
-            conn.close()
-
-        if row:
-            user = dict(row)
-            _cache[db_token] = (user, time.monotonic() + _CACHE_TTL)
+        user = await asyncio.to_thread(_lookup_session, db_token)
+        if user:
+            _cache_put(db_token, user)
             return user
     except sqlite3.OperationalError:
         logger.exception("Failed to query auth database at %s", settings.auth_db_path)
@@ -0,0 +1,61 @@
+"""Small in-process caches for async service calls."""
+
+import asyncio
+import functools
+import time
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(
+    ttl: float = 30.0,
+    key: Callable[..., Hashable] | None = None,
+    maxsize: int = 256,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Memoize an async function's result for ``ttl`` seconds.
+
+    Concurrent callers with the same key share a single in-flight call, so a
+    burst of identical requests costs one upstream round-trip. Failed or
+    cancelled calls are never cached. ``key`` receives the call's arguments
+    and returns the cache key; by default all arguments are used.
+
+    The wrapped function gains a ``cache_clear()`` method.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        # {key: (expires_at, task)} — insertion ordered, oldest first
+        entries: dict[Hashable, tuple[float, asyncio.Future[T]]] = {}
+
+        def _forget_failed(cache_key: Hashable, task: asyncio.Future[T]) -> None:
+            if task.cancelled() or task.exception() is not None:
+                entry = entries.get(cache_key)
+                if entry is not None and entry[1] is task:
+                    del entries[cache_key]
+
+        def _evict(now: float) -> None:
+            for k in [k for k, (expires, _) in entries.items() if expires <= now]:
+                del entries[k]
+            while len(entries) >= maxsize:
+                del entries[next(iter(entries))]
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                task = entry[1]
+            else:
+                if len(entries) >= maxsize:
+                    _evict(now)
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                entries[cache_key] = (now + ttl, task)
+                task.add_done_callback(functools.partial(_forget_failed, cache_key))
+            # Shield so one caller being cancelled doesn't cancel the shared call
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
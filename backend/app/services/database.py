@@ -1,18 +1,91 @@
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
 import aiosqlite
 
 from app.config import settings
 
 DB_PATH = settings.database_path
 
+# Per-connection tuning: WAL lets readers run alongside the single writer,
+# synchronous=NORMAL skips the fsync on every commit (safe under WAL), and
+# temp tables, page cache (64 MiB) and mmap (256 MiB) stay in memory.
+# busy_timeout waits out another connection's write lock (e.g. init_db or a
+# CLI session) instead of failing immediately with "database is locked".
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+"""
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict[str, Any]:
+    """Row factory returning plain dicts, so column access is a hash lookup."""
+    return dict(zip([column[0] for column in cursor.description], row))
+
+
+# Process-wide connection shared by all requests and background tasks.
+# Opened lazily on first use and closed from the app lifespan on shutdown.
+_db: aiosqlite.Connection | None = None
+_db_lock = asyncio.Lock()
+
 
 async def get_db() -> aiosqlite.Connection:
+    global _db
+    if _db is None:
+        async with _db_lock:
+            if _db is None:
+                # Larger statement cache (default 128) so every hot query
+                # keeps its compiled form instead of being re-prepared
+                db = await aiosqlite.connect(DB_PATH, cached_statements=256)
+                db.row_factory = _dict_row
+                await db.executescript(_CONNECTION_PRAGMAS)
+                _db = db
+    return _db
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[aiosqlite.Connection]:
+    """Run a multi-statement write atomically on a dedicated connection.
+
+    The shared connection sees its own uncommitted rows, and any coroutine's
+    ``commit()`` on it commits everything pending, so a write spread over
+    several awaits there can be read or committed half-done. Here nothing is
+    visible to other readers until the block commits, and an exception rolls
+    the whole block back. Do the network work before entering the block.
+    """
     db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row
-    return db
+    try:
+        db.row_factory = _dict_row
+        await db.executescript(_CONNECTION_PRAGMAS)
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            await db.rollback()
+            raise
+        await db.commit()
+    finally:
+        await db.close()
+
+
+async def close_db() -> None:
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
 
 
 async def init_db() -> None:
     async with aiosqlite.connect(DB_PATH) as db:
+        # Same tuning as the shared connection, so the schema setup and
+        # migrations below also run in WAL with synchronous=NORMAL
+        await db.executescript(_CONNECTION_PRAGMAS)
         await db.executescript(
             """
             CREATE TABLE IF NOT EXISTS repos (
@@ -286,4 +359,27 @@ async def init_db() -> None:
                 """
             )
 
+        # Composite indexes for the remediation skip-checks and session listing
+        # (after the rebuild above, which would drop them)
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_devin_sessions_lookup "
+            "ON devin_sessions(repo, alert_number, status)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_devin_sessions_repo_created "
+            "ON devin_sessions(repo, created_at DESC)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_api_remediation_jobs_lookup "
+            "ON api_remediation_jobs(repo, tool, alert_number, status)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_copilot_autofix_jobs_lookup "
+            "ON copilot_autofix_jobs(repo, alert_number, status)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_devin_sessions_refresh "
+            "ON devin_sessions(repo, session_id, file_path)"
+        )
+
         await db.commit()
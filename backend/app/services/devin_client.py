@@ -1,10 +1,13 @@
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import httpx
 
 from app.config import settings
 from app.models.schemas import Alert
+from app.services.cache import async_ttl_cache
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,17 @@ _MAX_RETRIES = 10
 _BASE_BACKOFF_SECONDS = 10.0
 _MAX_BACKOFF_SECONDS = 320.0
 
+# Pool limits for the process-wide client returned by get_devin_client().
+# Idle connections are kept past the 30s poll interval (httpx defaults to 5s)
+# so each status poll reuses the open TLS connection instead of reconnecting.
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0)
+
+# How long get_sessions_by_id() reuses one org-wide listing. Kept below the
+# shortest benchmark poll delay (DEVIN_POLL_INITIAL with jitter, ~1.6s) so a
+# fast poll after a state change always sees a fresh listing; concurrent
+# pollers still share the in-flight request.
+_SESSIONS_INDEX_TTL = 1.5
+
 
 class DevinClient:
     """Client for the Devin v3 Organization API.
@@ -22,7 +36,12 @@ class DevinClient:
     Retries on 429 with exponential backoff.
     """
 
-    def __init__(self, api_key: str | None = None, org_id: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        org_id: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.api_key = api_key or settings.devin_api_key
         self.org_id = org_id or settings.devin_org_id
         self.base_url = "https://api.devin.ai/v3"
@@ -30,6 +49,17 @@ class DevinClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        # Optional long-lived client whose connection pool is shared across calls
+        self._client = client
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client, or a short-lived one when none was given."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            yield client
 
     @property
     def _sessions_url(self) -> str:
@@ -94,7 +124,7 @@ class DevinClient:
     ) -> httpx.Response:
         """Make an HTTP request with retry on 429 rate limits."""
         for attempt in range(_MAX_RETRIES):
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with self._session() as client:
                 response = await client.request(method, url, **kwargs)
 
             if response.status_code != 429:
@@ -115,7 +145,7 @@ class DevinClient:
             await asyncio.sleep(wait)
 
         # Final attempt — let it raise on any error
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.request(method, url, **kwargs)
         response.raise_for_status()
         return response
@@ -183,6 +213,15 @@ class DevinClient:
         data = response.json()
         return data.get("items", [])
 
+    @async_ttl_cache(ttl=_SESSIONS_INDEX_TTL, key=lambda self: self.org_id)
+    async def get_sessions_by_id(self) -> dict[str, dict]:
+        """``list_sessions()`` keyed by session_id, cached for ``_SESSIONS_INDEX_TTL``.
+
+        Concurrent pollers (e.g. overlapping benchmark runs) share one
+        org-wide listing instead of each fetching it.
+        """
+        return {s["session_id"]: s for s in await self.list_sessions()}
+
     async def send_message(self, session_id: str, message: str) -> None:
         """Send a message to an existing Devin session."""
         await self._request_with_retry(
@@ -247,3 +286,22 @@ class DevinClient:
             f"6. Do NOT create a PR — push directly to the branch\n\n"
             f"Address the root cause of each issue."
         )
+
+
+_devin_client: DevinClient | None = None
+
+
+def get_devin_client() -> DevinClient:
+    """Return the process-wide DevinClient, backed by a pooled HTTP client."""
+    global _devin_client
+    if _devin_client is None or _devin_client._client is None or _devin_client._client.is_closed:
+        _devin_client = DevinClient(client=httpx.AsyncClient(timeout=30.0, limits=_HTTP_LIMITS))
+    return _devin_client
+
+
+async def close_devin_client() -> None:
+    """Close the shared Devin HTTP client (called on app shutdown)."""
+    global _devin_client
+    if _devin_client is not None and _devin_client._client is not None:
+        await _devin_client._client.aclose()
+    _devin_client = None
@@ -1,19 +1,35 @@
 import asyncio
 import logging
 import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable
 
 import httpx
 
 from app.config import settings
 from app.models.schemas import Alert, AlertWithCWE, BranchSummary
+from app.services.cache import async_ttl_cache
+from app.services.rate_limit import retry_on_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# Pool limits for the process-wide client behind get_github_client()
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# First page size for list_commits(since_sha=...), which usually finds only a
+# handful of new commits
+_COMMITS_PROBE_SIZE = 10
+
 
 class GitHubClient:
     BASE_URL = "https://api.github.com"
 
-    def __init__(self, token: str | None = None, repo: str | None = None):
+    def __init__(
+        self,
+        token: str | None = None,
+        repo: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.token = token or settings.github_token
         self.repo = repo or ""
         self.headers = {
@@ -21,6 +37,24 @@ class GitHubClient:
             "Authorization": f"Bearer {self.token}",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        # Optional long-lived client whose connection pool is shared
+        # across requests (see get_github_client).
+        self._client = client
+        # (branch, page) -> (ETag, alert count) for count_open_alerts()
+        self._alert_page_etags: dict[tuple[str, int], tuple[str, int]] = {}
+
+    def for_repo(self, repo: str) -> "GitHubClient":
+        """Return a client for ``repo`` that shares this client's connection pool."""
+        return GitHubClient(token=self.token, repo=repo, client=self._client)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client, or a short-lived one when none was given."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            yield client
 
     async def list_accessible_repos(self, per_page: int = 100) -> list[dict]:
         """List repositories accessible by the configured PAT.
@@ -31,7 +65,7 @@ class GitHubClient:
         repos: list[dict] = []
         page = 1
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             while True:
                 response = await client.get(
                     f"{self.BASE_URL}/user/repos",
@@ -68,7 +102,7 @@ class GitHubClient:
     async def get_repo_info(self, repo: str | None = None) -> dict:
         """Get metadata for a single repository."""
         target = repo or self.repo
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{target}",
                 headers=self.headers,
@@ -84,12 +118,23 @@ class GitHubClient:
                 "html_url": item.get("html_url", ""),
             }
 
-    async def get_alerts(self, branch: str, state: str | None = None, per_page: int = 100) -> list[Alert]:
-        """Fetch CodeQL alerts for a specific branch."""
+    async def get_alerts(
+        self,
+        branch: str,
+        state: str | None = None,
+        per_page: int = 100,
+        numbers: Iterable[int] | None = None,
+    ) -> list[Alert]:
+        """Fetch CodeQL alerts for a specific branch.
+
+        If ``numbers`` is given only those alerts are returned, and paging
+        stops as soon as all of them have been seen.
+        """
         alerts: list[Alert] = []
         page = 1
+        wanted = frozenset(numbers) if numbers is not None else None
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             while True:
                 params: dict[str, str | int] = {
                     "ref": f"refs/heads/{branch}",
@@ -111,6 +156,8 @@ class GitHubClient:
                     break
 
                 for item in data:
+                    if wanted is not None and item["number"] not in wanted:
+                        continue
                     rule = item.get("rule", {})
                     most_recent = item.get("most_recent_instance", {})
                     location = most_recent.get("location", {})
@@ -136,10 +183,65 @@ class GitHubClient:
 
                 if len(data) < per_page:
                     break
+                if wanted is not None and len(alerts) == len(wanted):
+                    break
                 page += 1
 
         return alerts
 
+    @async_ttl_cache(ttl=30, key=lambda self, branch: (self.repo, branch))
+    async def get_open_alerts(self, branch: str) -> list[Alert]:
+        """Fetch open alerts for a branch, cached for 30s.
+
+        Concurrent callers share one in-flight listing, so back-to-back
+        remediation runs against the baseline cost a single GitHub round-trip.
+        Use ``get_alerts`` where fresh data matters (scans, readiness polling).
+        """
+        return await self.get_alerts(branch, state="open")
+
+    async def count_open_alerts(self, branch: str, per_page: int = 100) -> int:
+        """Count open alerts on a branch with conditional requests.
+
+        Each page's ETag is remembered on this client, so repeat probes of an
+        unchanged branch get 304s, which skip the body and don't count
+        against the rate limit.
+        """
+        total = 0
+        page = 1
+        async with self._session() as client:
+            while True:
+                key = (branch, page)
+                cached = self._alert_page_etags.get(key)
+                headers = self.headers
+                if cached is not None:
+                    headers = {**self.headers, "If-None-Match": cached[0]}
+
+                response = await client.get(
+                    f"{self.BASE_URL}/repos/{self.repo}/code-scanning/alerts",
+                    headers=headers,
+                    params={
+                        "ref": f"refs/heads/{branch}",
+                        "state": "open",
+                        "per_page": per_page,
+                        "page": page,
+                    },
+                )
+                if response.status_code == 304 and cached is not None:
+                    count = cached[1]
+                else:
+                    response.raise_for_status()
+                    count = len(response.json())
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._alert_page_etags[key] = (etag, count)
+
+                total += count
+                if count < per_page:
+                    break
+                page += 1
+
+        return total
+
     def compute_branch_summary(self, alerts: list[Alert], branch: str, tool_name: str) -> BranchSummary:
         """Compute a summary from a pre-fetched list of alerts."""
         return self._build_summary(alerts, branch, tool_name)
@@ -187,7 +289,7 @@ class GitHubClient:
         enriched: list[AlertWithCWE] = []
         page = 1
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             while True:
                 params: dict[str, str | int] = {
                     "ref": f"refs/heads/{branch}",
@@ -244,7 +346,7 @@ class GitHubClient:
 
     async def get_alert_detail(self, alert_number: int) -> dict:
         """Get detailed information about a specific alert."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}/code-scanning/alerts/{alert_number}",
                 headers=self.headers,
@@ -254,7 +356,7 @@ class GitHubClient:
 
     async def get_branch_sha(self, branch: str) -> str:
         """Get the HEAD commit SHA of a branch."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}/git/ref/heads/{branch}",
                 headers=self.headers,
@@ -268,7 +370,7 @@ class GitHubClient:
         Returns the SHA of the new branch HEAD.
         """
         sha = await self.get_branch_sha(from_branch)
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.post(
                 f"{self.BASE_URL}/repos/{self.repo}/git/refs",
                 headers=self.headers,
@@ -282,13 +384,22 @@ class GitHubClient:
 
     async def branch_exists(self, branch: str) -> bool:
         """Check if a branch exists."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}/git/ref/heads/{branch}",
                 headers=self.headers,
             )
             return response.status_code == 200
 
+    async def delete_branch(self, branch: str) -> None:
+        """Delete a branch via GitHub API."""
+        async with self._session() as client:
+            response = await client.delete(
+                f"{self.BASE_URL}/repos/{self.repo}/git/refs/heads/{branch}",
+                headers=self.headers,
+            )
+            response.raise_for_status()
+
     # ------------------------------------------------------------------
     # Copilot Autofix helpers
     # ------------------------------------------------------------------
@@ -299,7 +410,7 @@ class GitHubClient:
         POST /repos/{owner}/{repo}/code-scanning/alerts/{number}/autofix
         Returns 202 on success (generation started).
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.post(
                 f"{self.BASE_URL}/repos/{self.repo}"
                 f"/code-scanning/alerts/{alert_number}/autofix",
@@ -315,7 +426,7 @@ class GitHubClient:
         Returns status (e.g. "pending", "succeeded", "failed") plus
         fix description and changes when succeeded.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}"
                 f"/code-scanning/alerts/{alert_number}/autofix",
@@ -331,7 +442,7 @@ class GitHubClient:
 
         POST /repos/{owner}/{repo}/code-scanning/alerts/{number}/autofix/commits
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.post(
                 f"{self.BASE_URL}/repos/{self.repo}"
                 f"/code-scanning/alerts/{alert_number}/autofix/commits",
@@ -353,9 +464,11 @@ class GitHubClient:
     ) -> dict:
         """Trigger autofix and poll until it completes or times out.
 
-        Returns the final autofix status dict.
+        Returns the final autofix status dict. Each trigger and status call
+        is retried on its own when rate limited, so a throttled status check
+        neither re-triggers the autofix nor restarts the wait.
         """
-        await self.trigger_autofix(alert_number)
+        await retry_on_rate_limit(lambda: self.trigger_autofix(alert_number))
         logger.info(
             "Triggered Copilot Autofix for alert #%d, polling...",
             alert_number,
@@ -364,12 +477,12 @@ class GitHubClient:
         deadline = time.monotonic() + max_wait
         while time.monotonic() < deadline:
             await asyncio.sleep(poll_interval)
-            status = await self.get_autofix_status(alert_number)
+            status = await retry_on_rate_limit(lambda: self.get_autofix_status(alert_number))
             state = status.get("status", "")
             if state in ("succeeded", "success", "failed", "dismissed", "skipped"):
                 return status
         # Timed out — return last known status
-        return await self.get_autofix_status(alert_number)
+        return await retry_on_rate_limit(lambda: self.get_autofix_status(alert_number))
 
     async def list_commits(
         self, branch: str, since_sha: str | None = None, per_page: int = 100,
@@ -379,20 +492,28 @@ class GitHubClient:
         Returns a list of dicts with keys: sha, message, author, date.
         When *since_sha* is provided the returned list excludes that commit
         and all of its ancestors (i.e. only newer commits are returned).
+        Usually only a few commits are new, so a small page is fetched first
+        and the full ``per_page`` listing only if *since_sha* isn't in it.
         """
-        params: dict[str, str | int] = {
-            "sha": branch,
-            "per_page": per_page,
-        }
+        async with self._session() as client:
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/repos/{self.repo}/commits",
-                headers=self.headers,
-                params=params,
-            )
-            response.raise_for_status()
-            raw_commits = response.json()
+            async def _fetch(page_size: int) -> list[dict]:
+                response = await client.get(
+                    f"{self.BASE_URL}/repos/{self.repo}/commits",
+                    headers=self.headers,
+                    params={"sha": branch, "per_page": page_size},
+                )
+                response.raise_for_status()
+                return response.json()
+
+            probe_size = min(_COMMITS_PROBE_SIZE, per_page)
+            raw_commits = await _fetch(probe_size if since_sha else per_page)
+            if (
+                since_sha
+                and len(raw_commits) == probe_size < per_page
+                and all(item.get("sha") != since_sha for item in raw_commits)
+            ):
+                raw_commits = await _fetch(per_page)
 
         commits: list[dict] = []
         for item in raw_commits:
@@ -412,7 +533,7 @@ class GitHubClient:
 
     async def get_file_content(self, path: str, ref: str) -> str:
         """Get file content from a specific branch."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}/contents/{path}",
                 headers=self.headers,
@@ -426,7 +547,7 @@ class GitHubClient:
 
     async def get_file_sha(self, path: str, ref: str) -> str:
         """Get the SHA of a file on a specific branch (needed for updates)."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.get(
                 f"{self.BASE_URL}/repos/{self.repo}/contents/{path}",
                 headers=self.headers,
@@ -450,7 +571,7 @@ class GitHubClient:
 
         encoded = base64.b64encode(new_content.encode("utf-8")).decode("ascii")
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._session() as client:
             response = await client.put(
                 f"{self.BASE_URL}/repos/{self.repo}/contents/{path}",
                 headers=self.headers,
@@ -464,3 +585,22 @@ class GitHubClient:
             response.raise_for_status()
             data = response.json()
             return data.get("commit", {}).get("sha", "")
+
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_github_client(repo: str | None = None) -> GitHubClient:
+    """Return a GitHubClient for ``repo`` backed by the process-wide connection pool."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=30.0, limits=_HTTP_LIMITS)
+    return GitHubClient(repo=repo, client=_http_client)
+
+
+async def close_github_client() -> None:
+    """Close the shared GitHub HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
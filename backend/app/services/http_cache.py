@@ -0,0 +1,37 @@
+"""Shared helpers for conditional (ETag) JSON responses."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def content_etag(body: bytes) -> str:
+    """Strong ETag derived from the response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" identify the same representation.
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+
+def json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str | None = None,
+) -> Response:
+    """Return ``body`` as JSON with an ETag, or 304 if the client already has it."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
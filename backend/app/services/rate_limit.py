@@ -0,0 +1,93 @@
+"""Client-side rate limiting and rate-limit retries for outbound API calls."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """Allow at most ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    Acquisitions are spaced evenly rather than allowed to burst, and waiting
+    callers sleep without blocking the event loop. Use as ``async with limiter:``
+    or ``await limiter.acquire()``.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next slot is free, then claim it."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        # Claim the slot before sleeping so concurrent callers queue up behind it
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+def _is_rate_limited(exc: httpx.HTTPStatusError) -> bool:
+    """True for 429s and GitHub's 403 secondary-rate-limit responses."""
+    status = exc.response.status_code
+    if status == 429:
+        return True
+    return status == 403 and "rate limit" in exc.response.text.lower()
+
+
+def _retry_after_seconds(exc: httpx.HTTPStatusError) -> float | None:
+    """Parse a numeric Retry-After header, if the response carried one."""
+    value = exc.response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+async def retry_on_rate_limit(
+    call: Callable[[], Awaitable[T]],
+    *,
+    max_attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+) -> T:
+    """Await ``call()``, backing off and retrying only when rate limited.
+
+    No delay is added on the happy path. On a rate-limit response the wait is
+    ``Retry-After`` when given, else ``base * 2**attempt`` plus jitter, capped
+    at ``cap`` seconds. Other errors, and the last attempt's, propagate.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except httpx.HTTPStatusError as exc:
+            attempt += 1
+            if attempt >= max_attempts or not _is_rate_limited(exc):
+                raise
+            wait = _retry_after_seconds(exc)
+            if wait is None:
+                wait = base * 2 ** (attempt - 1) + random.uniform(0, 0.5)
+            wait = min(cap, wait)
+            logger.warning(
+                "Rate limited by %s (attempt %d/%d), retrying in %.1fs",
+                exc.request.url.host, attempt, max_attempts, wait,
+            )
+            await asyncio.sleep(wait)
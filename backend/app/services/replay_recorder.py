@@ -5,15 +5,29 @@ tracks wall-clock time offsets, and records events with rich metadata
 as remediation proceeds.  Also tracks running cost per event.
 """
 
+import asyncio
 import json
 import logging
 import time
 from datetime import datetime, timezone
+from typing import Any, Iterable
 
 from app.services.database import get_db
+from app.services.repo_resolver import get_latest_tool_branches
 
 logger = logging.getLogger(__name__)
 
+# Max events written per executemany by the background flusher
+_FLUSH_BATCH_SIZE = 100
+
+# How long the flusher waits for more events before writing a partial batch
+_FLUSH_LINGER_SECONDS = 0.5
+
+_INSERT_EVENT_SQL = """INSERT INTO replay_events
+   (run_id, tool, event_type, detail, alert_number,
+    timestamp_offset_ms, metadata, cost_usd, cumulative_cost_usd, created_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
 # ---------------------------------------------------------------------------
 # Cost constants
 # ---------------------------------------------------------------------------
@@ -61,7 +75,7 @@ class ReplayRecorder:
         recorder = ReplayRecorder(tools=["anthropic", "openai"])
         await recorder.start()
 
-        await recorder.record(
+        recorder.record(
             tool="anthropic",
             event_type="api_call_sent",
             detail="Sending alert context to claude-opus-4-6",
@@ -70,6 +84,10 @@ class ReplayRecorder:
         )
 
         await recorder.finish()
+
+    Events are queued and written in batches by a background task, so
+    ``record()`` is a plain (non-async) call that never waits on SQLite. ``finish()`` (or ``flush()``) waits
+    for everything queued so far to be written.
     """
 
     def __init__(
@@ -86,6 +104,9 @@ class ReplayRecorder:
         self.run_id: int | None = None
         self._start_time: float = 0.0
         self._cumulative_cost: float = 0.0
+        # Event rows, plus None markers queued by flush() to cut a linger short
+        self._queue: asyncio.Queue[tuple | None] = asyncio.Queue()
+        self._flusher: asyncio.Task[None] | None = None
 
     @classmethod
     async def attach(
@@ -117,20 +138,20 @@ class ReplayRecorder:
         self._cumulative_cost = 0.0
 
         db = await get_db()
-        try:
-            cursor = await db.execute(
-                "INSERT INTO replay_runs"
-                " (repo, scan_id, started_at, status, tools, branch_name, total_cost_usd)"
-                " VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (self.repo, self.scan_id, now, "running", json.dumps(self.tools), self.branch_name, 0.0),
-            )
-            self.run_id = cursor.lastrowid
-            assert self.run_id is not None
-            await db.commit()
-            logger.info("Started replay recording run_id=%d tools=%s", self.run_id, self.tools)
-            return self.run_id
-        finally:
-            await db.close()
+        cursor = await db.execute(
+            "INSERT INTO replay_runs"
+            " (repo, scan_id, started_at, status, tools, branch_name, total_cost_usd)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.repo, self.scan_id, now, "running", json.dumps(self.tools), self.branch_name, 0.0),
+        )
+        self.run_id = cursor.lastrowid
+        assert self.run_id is not None
+        await db.commit()
+        if self.branch_name:
+            # This run's branch is now the latest for its tools
+            get_latest_tool_branches.cache_clear()
+        logger.info("Started replay recording run_id=%d tools=%s", self.run_id, self.tools)
+        return self.run_id
 
     def _offset_ms(self) -> int:
         """Milliseconds elapsed since start()."""
@@ -138,7 +159,7 @@ class ReplayRecorder:
             return 0
         return int((time.monotonic() - self._start_time) * 1000)
 
-    async def record(
+    def record(
         self,
         tool: str,
         event_type: str,
@@ -146,14 +167,14 @@ class ReplayRecorder:
         alert_number: int | None = None,
         metadata: dict[str, object] | None = None,
         cost_usd: float = 0.0,
-    ) -> int | None:
-        """Record a single event. Returns the event id, or None on failure.
+    ) -> None:
+        """Queue a single event for writing.
 
         If ``cost_usd`` is provided it is added to the cumulative total.
         """
         if self.run_id is None:
             logger.warning("ReplayRecorder.record() called before start(), skipping")
-            return None
+            return
 
         self._cumulative_cost += cost_usd
 
@@ -166,57 +187,99 @@ class ReplayRecorder:
             meta["event_cost_usd"] = round(cost_usd, 6)
         meta["cumulative_cost_usd"] = round(self._cumulative_cost, 6)
 
-        meta_json = json.dumps(meta, default=str)
+        # Serialized later by the flusher, off the event loop
+        self._queue.put_nowait((
+            self.run_id, tool, event_type, detail, alert_number,
+            offset_ms, meta, round(cost_usd, 6),
+            round(self._cumulative_cost, 6), now,
+        ))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+        logger.debug(
+            "Queued replay event run=%d tool=%s type=%s alert=%s offset=%dms cost=$%.6f cumulative=$%.6f",
+            self.run_id, tool, event_type, alert_number, offset_ms, cost_usd, self._cumulative_cost,
+        )
+
+    def record_many(self, events: Iterable[dict[str, Any]]) -> None:
+        """Queue several events at once; each dict holds ``record()`` kwargs.
 
+        Queued events are written together, so a group of same-shaped
+        events lands in one executemany and one commit.
+        """
+        for event in events:
+            self.record(**event)
+
+    async def _flush_loop(self) -> None:
+        """Write queued events in batches until the queue is empty.
+
+        A batch is written once it is full or ``_FLUSH_LINGER_SECONDS`` after
+        its first event, whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch: list[tuple] = []
+            deadline = loop.time() + _FLUSH_LINGER_SECONDS
+            while len(batch) < _FLUSH_BATCH_SIZE:
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if event is None:  # flush() is waiting, write what we have
+                    break
+                batch.append(event)
+            if batch:
+                await self._write_batch(batch)
+
+    @staticmethod
+    def _serialize_batch(batch: list[tuple]) -> list[tuple]:
+        """Swap each queued event's metadata dict for its JSON text."""
+        return [
+            (*row[:6], json.dumps(row[6], default=str), *row[7:])
+            for row in batch
+        ]
+
+    async def _write_batch(self, batch: list[tuple]) -> None:
+        """Insert a batch of events and add their cost to the run total."""
         db = await get_db()
         try:
-            cursor = await db.execute(
-                """INSERT INTO replay_events
-                   (run_id, tool, event_type, detail, alert_number,
-                    timestamp_offset_ms, metadata, cost_usd, cumulative_cost_usd, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    self.run_id, tool, event_type, detail, alert_number,
-                    offset_ms, meta_json, round(cost_usd, 6),
-                    round(self._cumulative_cost, 6), now,
-                ),
-            )
-            event_id = cursor.lastrowid
-
-            # Update the run's total cost atomically (safe for concurrent recorders)
-            await db.execute(
-                "UPDATE replay_runs SET total_cost_usd = total_cost_usd + ? WHERE id = ?",
-                (round(cost_usd, 6), self.run_id),
-            )
-
+            # Metadata can carry large raw API responses; encode them in a
+            # worker thread so the event loop keeps serving other requests
+            rows = await asyncio.to_thread(self._serialize_batch, batch)
+            await db.executemany(_INSERT_EVENT_SQL, rows)
+            batch_cost = round(sum(row[7] for row in batch), 6)
+            if batch_cost:
+                # Update the run's total cost atomically (safe for concurrent recorders)
+                await db.execute(
+                    "UPDATE replay_runs SET total_cost_usd = total_cost_usd + ? WHERE id = ?",
+                    (batch_cost, self.run_id),
+                )
             await db.commit()
-            logger.debug(
-                "Recorded replay event run=%d tool=%s type=%s alert=%s offset=%dms cost=$%.6f cumulative=$%.6f",
-                self.run_id, tool, event_type, alert_number, offset_ms, cost_usd, self._cumulative_cost,
-            )
-            return event_id
         except Exception:
-            logger.exception("Failed to record replay event")
-            return None
-        finally:
-            await db.close()
+            logger.exception("Failed to record %d replay event(s)", len(batch))
+
+    async def flush(self) -> None:
+        """Wait until every event queued so far has been written."""
+        if self._flusher is not None and not self._flusher.done():
+            self._queue.put_nowait(None)
+        while self._flusher is not None and not self._flusher.done():
+            await asyncio.shield(self._flusher)
 
     async def finish(self, status: str = "completed") -> None:
-        """Mark the replay run as finished."""
+        """Flush queued events and mark the replay run as finished."""
         if self.run_id is None:
             return
 
+        await self.flush()
+
         now = datetime.now(timezone.utc).isoformat()
         db = await get_db()
-        try:
-            await db.execute(
-                "UPDATE replay_runs SET status = ?, ended_at = ? WHERE id = ?",
-                (status, now, self.run_id),
-            )
-            await db.commit()
-            logger.info(
-                "Finished replay recording run_id=%d status=%s total_cost=$%.4f",
-                self.run_id, status, self._cumulative_cost,
-            )
-        finally:
-            await db.close()
+        await db.execute(
+            "UPDATE replay_runs SET status = ?, ended_at = ? WHERE id = ?",
+            (status, now, self.run_id),
+        )
+        await db.commit()
+        logger.info(
+            "Finished replay recording run_id=%d status=%s total_cost=$%.4f",
+            self.run_id, status, self._cumulative_cost,
+        )
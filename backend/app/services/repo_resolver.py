@@ -1,10 +1,13 @@
 """Shared utilities to resolve repo + tool branches."""
 
 import json
+from types import MappingProxyType
+from typing import Mapping
 
 from fastapi import HTTPException
 
 from app.config import settings
+from app.services.cache import async_ttl_cache
 from app.services.database import get_db
 
 
@@ -19,82 +22,90 @@ async def resolve_repo(repo: str | None) -> str:
             status_code=400,
             detail="repo query parameter is required. Select a repo in the UI.",
         )
+    return await _lookup_tracked_repo(repo)
 
+
+@async_ttl_cache(ttl=30)
+async def _lookup_tracked_repo(repo: str) -> str:
+    """Tracked-repo check behind resolve_repo; cached, cleared when repos change.
+
+    Untracked repos raise and so are never cached.
+    """
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT full_name FROM repos WHERE full_name = ? LIMIT 1",
-            (repo,),
+    cursor = await db.execute(
+        "SELECT full_name FROM repos WHERE full_name = ? LIMIT 1",
+        (repo,),
+    )
+    row = await cursor.fetchone()
+    if not row:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Repo '{repo}' is not tracked. Add it on /repos.",
         )
-        row = await cursor.fetchone()
-        if not row:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Repo '{repo}' is not tracked. Add it on /repos.",
-            )
-        return row["full_name"]
-    finally:
-        await db.close()
+    return row["full_name"]
 
 
 
+@async_ttl_cache(ttl=30)
 async def resolve_baseline_branch(repo: str) -> str:
     """Resolve the baseline branch for a repo.
 
     Uses the tracked repo's default_branch if present; otherwise falls back to
-    BRANCH_BASELINE from config.
+    BRANCH_BASELINE from config. Cached briefly; cleared when repos change.
     """
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT default_branch FROM repos WHERE full_name = ? LIMIT 1",
-            (repo,),
-        )
-        row = await cursor.fetchone()
-        if row and row["default_branch"]:
-            return row["default_branch"]
-    finally:
-        await db.close()
+    cursor = await db.execute(
+        "SELECT default_branch FROM repos WHERE full_name = ? LIMIT 1",
+        (repo,),
+    )
+    row = await cursor.fetchone()
+    if row and row["default_branch"]:
+        return row["default_branch"]
     return settings.branch_baseline
 
 
-async def get_latest_tool_branches(repo: str) -> dict[str, str]:
-
+@async_ttl_cache(ttl=30)
+async def get_latest_tool_branches(repo: str) -> Mapping[str, str]:
     """Return the latest known branch_name per tool for the given repo.
 
     We infer tool branches from replay_runs (each remediation run stores the
     branch it created). This keeps scan/report flows working without static
-    branch env vars.
+    branch env vars. Cached briefly (read-only, shared by callers); cleared
+    when a run with a new branch starts.
     """
     db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT tools, branch_name FROM replay_runs "
-            "WHERE repo = ? AND branch_name IS NOT NULL "
-            "ORDER BY started_at DESC",
-            (repo,),
-        )
-        rows = await cursor.fetchall()
-
-        branches: dict[str, str] = {}
-        for row in rows:
-            branch_name = row["branch_name"]
-            if not branch_name:
+    cursor = await db.execute(
+        "SELECT tools, branch_name FROM replay_runs "
+        "WHERE repo = ? AND branch_name IS NOT NULL "
+        "ORDER BY started_at DESC",
+        (repo,),
+    )
+    rows = await cursor.fetchall()
+
+    branches: dict[str, str] = {}
+    for row in rows:
+        branch_name = row["branch_name"]
+        if not branch_name:
+            continue
+        try:
+            tools = json.loads(row["tools"] or "[]")
+        except Exception:
+            tools = []
+
+        for tool in tools:
+            if tool == "baseline":
                 continue
-            try:
-                tools = json.loads(row["tools"] or "[]")
-            except Exception:
-                tools = []
-
-            for tool in tools:
-                if tool == "baseline":
-                    continue
-                if tool not in branches:
-                    branches[tool] = branch_name
-
-        return branches
-    finally:
-        await db.close()
+            if tool not in branches:
+                branches[tool] = branch_name
+
+    return MappingProxyType(branches)
+
+
+def clear_repo_caches() -> None:
+    """Drop cached repo lookups; call after tracked repos are added or removed."""
+    _lookup_tracked_repo.cache_clear()
+    resolve_baseline_branch.cache_clear()
+    get_latest_tool_branches.cache_clear()
 
 
 async def resolve_branch(repo: str, tool: str, branch: str | None = None) -> str:
@@ -5,14 +5,23 @@ then counts tokens using tiktoken (cl100k_base encoding, which is a
 reasonable approximation for all major model families).
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
-# cl100k_base is used by GPT-4/Claude/Gemini-class models as a reasonable approx
-_encoding = tiktoken.get_encoding("cl100k_base")
+# Texts longer than this are encoded in a worker thread by count_tokens_async
+_OFFLOAD_THRESHOLD_CHARS = 10_000
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Load the encoding once, on first use (tiktoken may need to download it)."""
+    # cl100k_base is used by GPT-4/Claude/Gemini-class models as a reasonable approx
+    return tiktoken.get_encoding("cl100k_base")
 
 # The prompt template mirrors what the remediation flow would actually send
 _PROMPT_TEMPLATE = """You are a security engineer. Fix the following vulnerability in the source code.
@@ -33,9 +42,22 @@ _PROMPT_TEMPLATE = """You are a security engineer. Fix the following vulnerabili
 Return ONLY the complete fixed file content. Do not include explanations."""
 
 
+@lru_cache(maxsize=128)
 def count_tokens(text: str) -> int:
-    """Count tokens in a string using cl100k_base encoding."""
-    return len(_encoding.encode(text))
+    """Count tokens in a string using cl100k_base encoding.
+
+    Memoized: the benchmark sends the same file-group prompt to every tool,
+    and scan estimates build those same prompts too.
+    """
+    # Source files may legitimately contain special-token text; count it as text
+    return len(_get_encoding().encode(text, disallowed_special=()))
+
+
+async def count_tokens_async(text: str) -> int:
+    """Count tokens without blocking the event loop on large prompts."""
+    if len(text) < _OFFLOAD_THRESHOLD_CHARS:
+        return count_tokens(text)
+    return await asyncio.to_thread(count_tokens, text)
 
 
 def build_prompt_for_alert(